@@ -15,7 +15,8 @@ level into harmonised format.
 **Dependencies**
 
 *require*:      :mod:`os`, :mod:`six`, :mod:`collections`, :mod:`functools`, :mod:`copy`,
-                :mod`datetime`, :mod:`numpy`, :mod:`pandas`
+                :mod`datetime`, :mod:`time`, :mod:`concurrent.futures`, :mod:`numpy`,
+                :mod:`pandas`
 
 *optional*:     :mod:`requests`, :mod:`simplejson`
 
@@ -30,10 +31,12 @@ level into harmonised format.
 
 #%% Settings
 
-import io, sys, re
+import io, os, sys, re
 from os import path as osp
 import functools
 import pprint, logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from collections.abc import Mapping, Sequence
 from six import string_types
@@ -50,15 +53,27 @@ from pyeudatnat.misc import Object, Structure, Type, FileSys
 from pyeudatnat.misc import DEF_DATETIMEFMT
 from pyeudatnat.io import Json, Frame, Buffer
 from pyeudatnat.io import FORMATS, DEF_FORMATS, DEF_FORMAT, ENCODINGS, DEF_ENCODING, DEF_SEP
+from pyeudatnat.io import DEF_CHUNKSIZE, DUMP_FORMATS, ARROW_FORMATS, APPEND_FORMATS
 from pyeudatnat.text import Interpret, TextProcess, isoLang
 from pyeudatnat.text import LANGS, DEF_LANG
-from pyeudatnat.geo import isoCountry, Service as GeoService
-from pyeudatnat.geo import DEF_CODER, DEF_PLACE
+from pyeudatnat.geo import isoCountry, Service as GeoService, Cache as GeoCache, Centroid, Gazetteer
+from pyeudatnat.geo import Resolver as GeoResolver
+from pyeudatnat.geo import DEF_CODER, DEF_PLACE, DEF_PROJ4LL
 
 
-PROCESSES           = [ 'fetch', 'load', 'prepare', 'clean', 'translate',
+PROCESSES           = [ 'fetch', 'load', 'compact', 'prepare', 'clean', 'translate',
                         'locate', 'format', 'save' ]
 
+DEF_PROCESSES       = [ 'fetch', 'load', 'prepare', 'clean', 'locate',
+                        'format', 'save' ] # the processes run on every country
+
+LOAD_DTYPES         = { 'str':      str,
+                        'datetime': str # parsed after loading, see _load_source
+                        }
+"""Reader types of the columns, following the types of the template index; numeric
+columns are cast after loading, since their parsing depends on the source dialect.
+"""
+
 
 #%% Core functions/classes
 
@@ -496,20 +511,36 @@ class BaseDatNat():
         if self.file != file:               self.file = file
 
     #/************************************************************************/
-    def load_data(self, *src, **kwargs):
-        """Load data source file.
+    def _load_source(self, *src, **kwargs):
+        """Load data source file into a dataframe, or an iterator of dataframes
+        when a 'chunksize' option is set.
 
-                >>> datnat.load_data(*src, **kwargs)
+                >>> data = datnat._load_source(*src, **kwargs)
         """
         # retrieve a default date format
         ignore_buffer = kwargs.pop('ignore_buffer', False)
         opts_load = self.get_options(opts = kwargs, process = 'load')
-        if ignore_buffer is False and self.buff is not None:
-            try:
-                self.data = Frame.from_buffer(self.buff,  **opts_load)
-            except:
-                self.data = Frame.from_data(self.buff, **opts_load)
-                self.buff = None
+        pushdown = opts_load.pop('pushdown', False)
+        dtfmt = opts_load.pop('dtfmt', None)
+        schema, dates = {}, []
+        if pushdown is True:
+            schema, dates = self._load_schema()
+            # explicit reader options prevail
+            schema = {k:v for (k,v) in schema.items() if k not in opts_load}
+        buff = self.buff if ignore_buffer is False else None
+        def _read(**opts):
+            if buff is not None:
+                try:
+                    data = Frame.from_buffer(buff,  **opts)
+                except:
+                    data = Frame.from_data(buff, **opts)
+                    self.buff = None
+            else:
+                opts.update(self.cache)
+                data = Frame.from_file(file, src = src, **opts)
+            return data
+        if buff is not None:
+            src = file = None
         else:
             src = (src not in ((None,),()) and src[0])                          \
                 or kwargs.pop('src', None) or self.src
@@ -521,10 +552,100 @@ class BaseDatNat():
             elif not(file is None or isinstance(file, string_types)     \
                      or (isinstance(file, Sequence) and all([isinstance(f,string_types) for f in file]))):
                  raise TypeError("Wrong format for filename - must be a (list of) string(s)")
-            opts_load.update(self.cache)
-            self.data = Frame.from_file(file, src = src, **opts_load)
+        try:
+            data = _read(**opts_load, **schema)
+            assert schema == {} or not isinstance(data, pd.DataFrame) or len(data.columns) > 0
+        except:
+            if schema == {}:
+                raise
+            try: # a buffer already parsed is read again from its start
+                assert buff is None or isinstance(buff, string_types)
+            except AssertionError:
+                try:
+                    buff.seek(0)
+                except:     raise IOError("Columns or types of the index not matched in buffer - set PUSHDOWN to False")
+            logging.warning("\n! Columns or types of the index not matched in source - all columns loaded !")
+            data, dates = _read(**opts_load), []
+        if src is not None or file is not None:
             if self.src != src:             self.src = src
             if self.file != file:           self.file = file
+        if isinstance(data, pd.DataFrame) and dtfmt not in (None, ''):
+            # parse the dates once, at load time
+            for col in [c for c in data.columns if c in dates]:
+                data[col] = pd.to_datetime(data[col], format = dtfmt, errors = 'coerce')
+        return data
+
+    #/************************************************************************/
+    def _load_schema(self):
+        """Compile the index of the template and the metadata into reader options,
+        so that only the columns named in the metadata are loaded, and the text
+        columns are not type-inferred; it is run when the 'pushdown' load option
+        is set.
+
+                >>> schema, dates = datnat._load_schema()
+
+        Returns
+        -------
+        schema : dict
+            'usecols' and 'dtype' options of the readers; numeric types are not set,
+            since they depend on the dialect of the source (e.g., decimal commas),
+            and are cast after loading.
+        dates : list
+            names of the source columns of datetime type.
+        """
+        try:
+            assert self.idx not in (None, {})
+        except AssertionError:
+            return {}, []
+        oindex = self.config.get('index', {}) or {}
+        place = self.meta.get('place') or DEF_PLACE
+        if isinstance(place, Mapping):
+            place = list(place.keys())
+        elif isinstance(place, string_types):
+            place = [place,]
+        def _names(col): # column names in any (nested) entry of the index
+            if isinstance(col, string_types):
+                return [col,] if col != '' else []
+            elif isinstance(col, Mapping):
+                col = list(col.values())
+            elif not isinstance(col, Sequence):
+                return []
+            return [n for c in col for n in _names(c)]
+        fields = {}
+        for ind, col in self.idx.items():
+            try:
+                typ = oindex[ind].get('type') if isinstance(col, string_types) else None
+            except:
+                typ = None
+            for n in _names(col):
+                # a column shared by several fields (e.g., 'lat' and 'lon') is not typed
+                fields.update({n: None if n in fields else typ})
+        for p in place:
+            for n in _names(self.idx.get(p) or p):
+                fields.setdefault(n, None)
+        # all the columns of the metadata are kept (e.g., for prepare_data), and
+        # source columns may be named in any of its languages
+        for c in (self.cols or []):
+            for n in _names(c):
+                fields.setdefault(n, None)
+        names = {}
+        for col, typ in fields.items():
+            for n in [col,] + [v for c in (self.cols or []) if col in c.values() for v in c.values()]:
+                names.update({n: typ})
+        dtypes = {n: LOAD_DTYPES[typ] for (n, typ) in names.items() if typ in LOAD_DTYPES}
+        dates = [n for (n, typ) in names.items() if typ == 'datetime']
+        schema = {'usecols': frozenset(names).__contains__}
+        if dtypes != {}:
+            schema.update({'dtype': dtypes})
+        return schema, dates
+
+    #/************************************************************************/
+    def load_data(self, *src, **kwargs):
+        """Load data source file.
+
+                >>> datnat.load_data(*src, **kwargs)
+        """
+        self.data = self._load_source(*src, **kwargs)
         try:
             assert self.cols not in (None,[],[{}])
         except:
@@ -533,6 +654,35 @@ class BaseDatNat():
         #    logging.warning("\n! mismatched data columns and header fields !")
         # if everything worked well, update the fields in case they differ
 
+    #/************************************************************************/
+    def compact_data(self, **kwargs):
+        """Compact the in-memory representation of the loaded data, see
+        :meth:`io.Frame.compact`, and report the memory used before and after.
+
+                >>> datnat.compact_data(cardinality = io.DEF_CATEGORIES, strings = True,
+                                        downcast = True)
+
+        Keyword arguments
+        -----------------
+        cardinality, strings, downcast :
+            see :meth:`io.Frame.compact`; these can also be set through the 'compact'
+            options.
+
+        Note
+        ----
+        This process is not part of :data:`DEF_PROCESSES` and shall be run explicitly:
+        text columns stored as categorical may alter the string processing run
+        afterwards (see :meth:`prepare_data` and :meth:`locate_data`).
+        """
+        if not isinstance(self.data, pd.DataFrame):
+            return
+        opts_compact = self.get_options(opts = kwargs, process = 'compact')
+        nkw = Object.inspect_kwargs(opts_compact, Frame.compact)
+        before = self.data.memory_usage(deep = True).sum()
+        self.data = Frame.compact(self.data, **nkw)
+        after = self.data.memory_usage(deep = True).sum()
+        logging.warning("\n! Data compacted from %.1f MB to %.1f MB !" % (before / 1024**2, after / 1024**2))
+
     #/************************************************************************/
     def get_cols(self, *columns, **kwargs):
         """Retrieve the name of the column associated to a given field (e.g., manually
@@ -741,7 +891,7 @@ class BaseDatNat():
                                 )
                             )
         # drop the columns
-        self.data.drop(columns = list(columns), axis = 1,
+        self.data.drop(columns = list(columns),
                        inplace = True, errors = 'ignore')
 
     #/************************************************************************/
@@ -802,6 +952,35 @@ class BaseDatNat():
         columns in the source file, or by geocoding the location name.
 
             >>> datnat.locate_data(latlon = ['lat', 'lon'], **kwargs)
+
+        Keyword arguments
+        -----------------
+        batch : bool
+            flag set to geocode every distinct place only once, and broadcast the
+            coordinates back to all the rows; default: `True`; this can also be set
+            through the 'locate' options. Places are identified by their canonical
+            keys, see :meth:`text.TextProcess.normalise`\ .
+        accents : bool
+            flag set to fold the accents in the canonical keys of the places;
+            default: `True`; this can also be set through the 'locate' options.
+        cache : bool, str, geo.Cache
+            persistent geocoding cache; when not set, a cache is used in the
+            'cache_store' directory whenever 'caching' is set.
+        workers, rate, burst, retries, backoff :
+            concurrency, rate limitation and retries of the geocoding requests,
+            see :meth:`geo.Service.locate_pool`; these can also be set through
+            the 'locate' options.
+        tiers : list
+            geocoders run as a chain of tiers in cost order (cache, local gazetteer,
+            free remote geocoders, paid ones), every tier only being parsed the
+            places the previous ones could not resolve, see :class:`geo.Resolver`;
+            when set, it supersedes the 'gc' geocoder; this can also be set through
+            the 'locate' options.
+        centroids : str, geo.Centroid
+            table of postcode/LAU centroids (see :class:`geo.Centroid`) used to
+            locate the places that were not geocoded; the quality of the locations
+            is then set (see :data:`geo.GEO_QUALITY`); this can also be set through
+            the 'locate' options.
         """
         latlon = (latlon not in ((None,),()) and latlon)                    \
             or kwargs.pop('latlon', None)
@@ -833,10 +1012,24 @@ class BaseDatNat():
         oproj = kwargs.pop('proj', oopts.get('proj'))
         oplace = oopts.get('place') or 'place'
         opts_locate = self.get_options(opts = kwargs, process = 'locate')
-        # setting geocoding service (may be of no use)
+        # setting persistent geocoding cache, following the caching arguments
+        geocache = opts_locate.get('cache')
+        if geocache is None and self.cache.get('caching') is True:
+            try:
+                geocache = GeoCache(self.cache.get('cache_store'),
+                                    expire = self.cache.get('cache_expire'),
+                                    force = self.cache.get('cache_force'))
+            except:
+                logging.warning("\n! Geocoding cache not available !")
+                geocache = None
+        # setting geocoding service (may be of no use), possibly a chain of tiers
+        geocoder = opts_locate.get('gc', DEF_CODER)
         try:
-            geocoder = opts_locate.get('gc', DEF_CODER)
-            geoserv = GeoService(geocoder)
+            tiers = opts_locate.get('tiers')
+            if tiers not in (None, []):
+                geoserv = GeoResolver(tiers, cache = geocache, cc = self.cc)
+            else:
+                geoserv = GeoService(geocoder, cache = geocache)
         except:
             geoserv = None
         # defining names of geographical coordinates
@@ -865,34 +1058,68 @@ class BaseDatNat():
                     self.data.rename(columns={lon: olon}, inplace=True)
             geo_qual = 1
         else:
+            # offline gazetteers only know the fields their index was built with
+            gazetteer = [serv.geoclient for serv in
+                         (geoserv.services if isinstance(geoserv, GeoResolver) else [geoserv,])
+                         if serv is not None and isinstance(serv.geoclient, Gazetteer)]
+            gazetteer = gazetteer[0] if gazetteer != [] else None
+            local = None
             if not oplace in self.data.columns:
                 mplace = self._match_cols(place, keep = True)
-                place = [p for p in  [mplace[_] for _ in place]
-                         if p in self.data.columns]
+                fields = {f: mplace[f] for f in place
+                          if isinstance(mplace.get(f), string_types) and mplace[f] in self.data.columns}
                 # place = list(set(list(place.values())).intersecmtion(self.data.columns))
-                if place == []:
+                if fields == {}:
                     raise IOError("No PLACE column(s) to be used for geolocation found in dataset")
-                self.data[oplace] = (
-                    self.data[place]
-                    .astype(str)
-                    .apply(lambda s: TextProcess.join(s, delim = ', '), axis=1)
-                    )
+                data = self.data[list(dict.fromkeys(fields.values()))].copy()
+                if 'postcode' in fields:
+                    data[fields['postcode']] = \
+                        TextProcess.normalise_postcode(data[fields['postcode']], cc = self.cc).to_numpy()
+                self.data[oplace] = TextProcess.join_columns(data, delim = ', ')
+                if gazetteer is not None and gazetteer.fields != []:
+                    # keys built as those of the gazetteer: same fields (e.g., without
+                    # the country), in the same order
+                    local = Gazetteer.make_keys(self.data, {f: fields[f] for f in gazetteer.fields
+                                                            if f in fields}, cc = gazetteer.cc)
             try:
                 assert 'place' in oindex.keys()                             \
                     and 'place' in self.idx and self.idx['place'] != None
             except:     pass
             else:
                 self.idx.update({'place': oplace})
+            batch = opts_locate.get('batch', True)
             f = lambda place : geoserv.locate_apply(place)
              # f = lambda place : geoserv.locate(place)
             try:                    f(-1)
             except ImportError:     raise IOError("No geocoder available")
             except:
-                self.data[olat], self.data[olon] = \
-                    zip(*self.data[oplace].apply(f))
+                if batch is True: # distinct places are geocoded only once
+                    keys = TextProcess.normalise(self.data[oplace], cc = self.cc,
+                                                 accents = opts_locate.get('accents', True))
+                    self.data[olat], self.data[olon] = \
+                        geoserv.locate_batch(self.data[oplace], keys = keys, local = local,
+                                             **{k: opts_locate[k] for k in
+                                                ('workers','rate','burst','shared','retries','backoff')
+                                                if k in opts_locate})
+                else:
+                    self.data[olat], self.data[olon] = \
+                        zip(*self.data[oplace].apply(f))
                 self.proj = None
                 self.geocoder = geocoder
             geo_qual = None # TBD
+            centroids = opts_locate.get('centroids')
+            if centroids is not None: # fallback to the centroids of postcodes/LAUs
+                try:
+                    centroids = Centroid.get(centroids)
+                except:     raise IOError("Centroids of postcodes/LAUs not available")
+                mcodes = self._match_cols(['postcode', 'lau'], keep = True)
+                codes = {k: self.data[c].to_numpy() for (k, c) in mcodes.items()
+                         if isinstance(c, string_types) and c in self.data.columns}
+                if olat not in self.data.columns or olon not in self.data.columns:
+                    self.data[olat] = self.data[olon] = np.nan
+                self.data[olat], self.data[olon], geo_qual =                \
+                    centroids.fill(self.data[olat], self.data[olon], cc = self.cc,
+                                   postcodes = codes.get('postcode'), laus = codes.get('lau'))
         try:
             assert ('lat' in oindex.keys() and 'lon' in oindex.keys())      \
                 and ('lat' in self.idx and 'lon' in self.idx)               \
@@ -901,7 +1128,7 @@ class BaseDatNat():
         else:
             self.idx.update({'lat': olat, 'lon': olon})
         # handling geocoding quality
-        if geo_qual:
+        if geo_qual is not None:
             oqual = oindex.get('geo_qual',{}).get('name') or 'geo_qual'
             self.data[oqual] = geo_qual
         else:
@@ -923,13 +1150,15 @@ class BaseDatNat():
         else:
             self.proj = iproj # update
         if oproj is not None and iproj not in (None,'') and iproj != oproj:
-            f = lambda l, L : geoserv.project_apply([l, L], iproj, oproj)
+            # f = lambda l, L : geoserv.project_apply([l, L], iproj, oproj)
             # f = lambda l, L :                                               \
             #     geoserv.project([l, L], iproj = iproj, oproj = oproj, **opts_locate)
-            try:                    f(-1)
+            try:
+                self.data[olat], self.data[olon] = \
+                    GeoService.project_batch(self.data[olat], self.data[olon], iproj, oproj)
             except ImportError:     raise IOError("No projection transformer available")
-            except:
-                self.data[olat], self.data[olon] = zip(*self.data[[olat, olon]].apply(f))
+            except:                 raise IOError("Projection of coordinates failed...")
+            else:
                 self.proj = oproj # update
                 self.geocoder = geocoder # update, if not done already earlier
         # cast
@@ -1043,7 +1272,7 @@ class BaseDatNat():
             if cast == self.data[ind].dtype:
                 continue
             elif cast == datetime:
-                self.data[ind] = Frame.cast(self.data, ind, odfmt = odtfmt, idfmt = idtfmt)
+                self.data[ind] = Frame.cast(self.data, ind, ofmt = odtfmt, ifmt = idtfmt)
             else:
                 self.data[ind] = Frame.cast(self.data, ind, cast)
             try:
@@ -1140,7 +1369,9 @@ class BaseDatNat():
         # first consider the generic options, then the country-specific as well
         # as the locally parsed options that supersede/override them
         opts_save = self.get_options(opts = kwargs, process = 'save')
-        formats = opts_save.pop('fmt', None) or {f:f for f in DEF_FORMATS}
+        odest = opts_save.pop('dest', None) # not parsed to the writers
+        dest = dest or odest
+        formats = opts_save.pop('fmt', None) or {f:f for f in DUMP_FORMATS}
         if fmt is None: # we give it a default value...
             try:
                 fmt = FileSys.extname(dest)
@@ -1189,9 +1420,8 @@ class BaseDatNat():
                 latlon = oindex['lat']['name'], oindex['lon']['name']
             except:     raise IOError("Geographic LATLON columns not set")
         self.data.reindex(columns = columns)
-        columns = list(set(columns)
-                       .intersection(set(self.data.columns))
-                       )
+        # keep the order of the columns, so that chunks can be appended
+        columns = [col for col in dict.fromkeys(columns) if col in self.data.columns]
         try:
             assert columns not in (None,[])
         except:
@@ -1199,11 +1429,89 @@ class BaseDatNat():
             return
         opts_save.update({'fmt': fmt, 'columns': columns})
         if fmt == 'csv':
-            opts_save.update({'header': True, 'index': False})
-        elif fmt in ('json','geojson','gpkg'):
+            opts_save.update({'header': opts_save.get('mode', 'w') != 'a', 'index': False})
+        elif fmt in ('json','geojson','geojsonl','gpkg'):
             opts_save.update({'as_str': False, 'latlon': latlon})
+        elif fmt in ARROW_FORMATS: # typed after the template index
+            opts_save.update({'latlon': latlon, 'crs': opts_save.get('crs') or self.proj,
+                              'dtypes': {ind['name']: ind.get('type') for ind in oindex.values()
+                                         if isinstance(ind, Mapping) and 'name' in ind}})
         Frame.to_file(self.data, dest, **opts_save)
 
+    #/************************************************************************/
+    def stream_data(self, *src, **kwargs):
+        """Run the processing pipeline (load, prepare, clean, locate, format and
+        save) chunk by chunk, so that memory usage is bounded by the size of the
+        chunks rather than the size of the dataset.
+
+            >>> datnat.stream_data(*src, chunksize = DEF_CHUNKSIZE, dest = None,
+                                   fmt = None, **kwargs)
+
+        Keyword arguments
+        -----------------
+        chunksize : int
+            number of rows per chunk; default: :data:`io.DEF_CHUNKSIZE`\ .
+        compact : bool
+            flag set to compact every chunk after loading (see :meth:`compact_data`);
+            default: `False`.
+        dest, fmt :
+            see :meth:`save_data`; the format shall support appending, *i.e.* be
+            any of :data:`io.APPEND_FORMATS`\ .
+
+        Other keyword arguments are passed to the loading operation, while the
+        other processes use the options set in :attr:`options`\ .
+
+        Note
+        ----
+        At the end of the run, :attr:`data` is reset to `None`.
+        """
+        chunksize = kwargs.pop('chunksize', None) or DEF_CHUNKSIZE
+        try:
+            assert isinstance(chunksize, int) and chunksize > 0
+        except AssertionError:
+            raise TypeError("Wrong format for CHUNKSIZE '%s' - must be a positive integer" % chunksize)
+        compact = kwargs.pop('compact', False)
+        dest = kwargs.pop('dest', None)
+        fmt = kwargs.pop('fmt', None)
+        # check the output format before anything is loaded: chunks are appended
+        formats = self.get_options(process = 'save').get('fmt') or {f:f for f in DUMP_FORMATS}
+        if fmt is None:
+            try:
+                fmt = FileSys.extname(dest)
+                assert fmt != ''
+            except:
+                fmt = list(formats.keys())[0] or DEF_FORMAT
+        elif not isinstance(fmt, string_types):
+            raise TypeError("Wrong input format - must be a string key")
+        fmt = fmt.lower()
+        try:
+            assert formats.get(fmt, fmt) in APPEND_FORMATS
+        except:
+            raise IOError("Wrong format FMT '%s' for streaming - must be any format supporting append among '%s'"
+                          % (fmt, APPEND_FORMATS))
+        kwargs.update({'chunksize': chunksize})
+        chunks = self._load_source(*src, **kwargs)
+        if isinstance(chunks, pd.DataFrame):
+            chunks = Frame.iter_chunks(chunks, chunksize)
+        # every chunk is processed from the same initial state
+        cols, idx = deepcopy(self.cols), deepcopy(self.idx)
+        nchunks = nrows = 0
+        for chunk in chunks:
+            self.cols, self.idx = deepcopy(cols), deepcopy(idx)
+            self.data = chunk
+            if self.cols in (None,[],[{}]):
+                self.cols = [{self.lang:col} for col in self.data.columns]
+            if compact is True:
+                self.compact_data()
+            self.prepare_data()
+            self.clean_data()
+            self.locate_data()
+            self.format_data()
+            self.save_data(dest, fmt = fmt, mode = 'w' if nchunks == 0 else 'a')
+            nchunks, nrows = nchunks + 1, nrows + len(chunk)
+        logging.warning("\n! %s rows processed in %s chunk(s) !" % (nrows, nchunks))
+        self.data = None
+
     #/************************************************************************/
     def _dump_config(self, **kwargs):
         logging.warning("\n! Method not implemented !")
@@ -1450,3 +1758,165 @@ def datnatFactory(*args, **kwargs):
         name = 'New%s' % basecls.__name__.replace('Base','')
     return type(name, (basecls,), attributes)
 
+
+#==============================================================================
+# Function datnatRun
+#==============================================================================
+
+def datnatRun(config, meta, **kwargs):
+    """Run the whole processing of a national dataset, from fetching the source
+    data to saving the harmonised output.
+
+        >>> report = datnatRun(config, meta, processes = DEF_PROCESSES, **kwargs)
+
+    Arguments
+    ---------
+    config : dict
+        configuration of the category, see :meth:`datnatFactory`\ .
+    meta : dict, str
+        metadata of the country, or JSON filename, see :meth:`datnatFactory`\ .
+
+    Keyword arguments
+    -----------------
+    processes : list
+        processes run, in that order; default: :data:`DEF_PROCESSES`\ ; other
+        keyword arguments (e.g., 'options', 'caching', ...) are parsed to the
+        instantiation of the national class.
+
+    Returns
+    -------
+    report : dict
+        report of the run, with the keys: 'cc', 'status' ('done' or 'failed'),
+        'process' (last process run), 'rows', 'time' (in seconds) and 'error'.
+
+    Note
+    ----
+    Any error is reported, not raised.
+    """
+    processes = kwargs.pop('processes', None) or DEF_PROCESSES
+    report = {'cc': None, 'status': 'failed', 'process': None,
+              'rows': None, 'time': None, 'error': None}
+    start = time.time()
+    try:
+        report.update({'process': 'init'})
+        datnat = datnatFactory(config, meta = meta)(**kwargs)
+        report.update({'cc': datnat.cc})
+        for process in processes:
+            report.update({'process': process})
+            getattr(datnat, '%s_data' % process)()
+    except Exception as e:
+        report.update({'error': '%s: %s' % (e.__class__.__name__, e)})
+    else:
+        report.update({'status': 'done'})
+        try:    report.update({'rows': len(datnat.data)})
+        except: pass
+    report.update({'time': time.time() - start})
+    return report
+
+
+#==============================================================================
+# Function datnatBatch
+#==============================================================================
+
+def datnatBatch(config, metas, **kwargs):
+    """Run in parallel the processing of several national datasets of the same
+    category, each country in its own process.
+
+        >>> report = datnatBatch(config, metas, area = None, workers = None, **kwargs)
+
+    Arguments
+    ---------
+    config : dict, MetaDat
+        configuration of the category, shared by all countries.
+    metas : list, dict
+        metadata of the countries (dictionaries or JSON filenames), possibly
+        indexed by country code.
+
+    Keyword arguments
+    -----------------
+    area : str
+        area (e.g., 'EU27_2020') from :data:`AREAS` used to select the countries
+        to run; default: all countries with metadata are run.
+    workers : int
+        maximum number of countries run concurrently; default: the number of
+        available CPUs.
+    processes :
+        see :meth:`datnatRun`\ ; other keyword arguments are parsed as well to
+        :meth:`datnatRun`\ .
+
+    Returns
+    -------
+    report : pd.DataFrame
+        summary report, with one row per country (see :meth:`datnatRun`).
+
+    Example
+    -------
+
+        >>> report = datnatBatch(config, ['AThcs.json', 'BEhcs.json', ...],
+                                 area = 'EU27_2020', workers = 8)
+    """
+    if isinstance(config, MetaDat):
+        config = config.to_dict()
+    elif isinstance(config, Mapping):
+        config = dict(config)
+    else:
+        raise TypeError("Configuration type '%s' not recognised - must be a dictionary or %s" % (type(config),MetaDat.__name__))
+    if isinstance(metas, (string_types,MetaDatNat)):
+        metas = [metas,]
+    if isinstance(metas, Mapping):
+        metas = list(metas.items())
+    elif isinstance(metas, Sequence):
+        metas = [(None, meta) for meta in metas]
+    else:
+        raise TypeError("METAdata type '%s' not recognised - must be a list or a dictionary" % type(metas))
+    area = kwargs.pop('area', None)
+    try:
+        assert area is None or area in AREAS
+    except AssertionError:
+        raise IOError("AREA '%s' not recognised - must be any from the list '%s'" % (area, list(AREAS.keys())))
+    # resolve the countries (metadata are loaded here, and parsed as dictionaries
+    # to the processes)
+    tasks = {}
+    for cc, meta in metas:
+        try:
+            meta = MetaDatNat(meta)
+        except:     raise IOError("Metadata '%s' not recognised" % meta)
+        cc = cc or meta.cc
+        if area is not None and cc not in AREAS[area]:
+            continue
+        tasks.update({cc: meta.to_dict()})
+    if tasks == {}:
+        logging.warning("\n! No country to process !")
+        return pd.DataFrame(columns = ['cc', 'status', 'process', 'rows', 'time', 'error'])
+    if area is not None and set(AREAS[area]).difference(tasks.keys()) != set():
+        logging.warning("\n! No metadata available for countries %s of area %s !"
+                        % (sorted(set(AREAS[area]).difference(tasks.keys())), area))
+    workers = kwargs.pop('workers', None) or os.cpu_count() or 1
+    try:
+        assert isinstance(workers, int) and workers > 0
+    except AssertionError:
+        raise TypeError("Wrong format for WORKERS '%s' - must be a positive integer" % workers)
+    reports = []
+    start = time.time()
+    with ProcessPoolExecutor(max_workers = min(workers, len(tasks))) as executor:
+        futures = {executor.submit(datnatRun, config, meta, **kwargs): cc
+                   for (cc, meta) in tasks.items()}
+        for future in as_completed(futures):
+            cc = futures[future]
+            try:
+                report = future.result()
+            except Exception as e: # e.g., the process terminated abruptly
+                report = {'status': 'failed', 'error': '%s: %s' % (e.__class__.__name__, e)}
+            report.update({'cc': report.get('cc') or cc})
+            if report['status'] == 'failed':
+                logging.warning("\n! Country %s failed at '%s' - %s !"
+                                % (cc, report.get('process'), report.get('error')))
+            reports.append(report)
+    report = (pd.DataFrame(reports, columns = ['cc', 'status', 'process', 'rows', 'time', 'error'])
+              .sort_values('cc')
+              .reset_index(drop = True))
+    logging.warning("\n! %s countries processed in %.1fs (sum of the runs: %.1fs) - %s failed !"
+                    % (len(report), time.time() - start, report['time'].sum(),
+                       (report['status'] == 'failed').sum()))
+    return report
+
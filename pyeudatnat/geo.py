@@ -18,9 +18,11 @@ processing.
 
 **Dependencies**
 
-*require*:      :mod:`os`, :mod:`six`, :mod:`collections`, :mod:`numpy`, :mod:`pandas`
+*require*:      :mod:`os`, :mod:`six`, :mod:`collections`, :mod:`numpy`, :mod:`pandas`,
+                :mod:`sqlite3`, :mod:`concurrent.futures`, :mod:`json`, :mod:`threading`,
+                :mod:`requests`
 
-*optional*:     :mod:`geopy`, :mod:`happygisco`, :mod:`pyproj`
+*optional*:     :mod:`geopy`, :mod:`happygisco`, :mod:`pyproj`, :mod:`pyarrow`
 
 *call*:         :mod:`pyeudatnat`
 
@@ -32,16 +34,25 @@ processing.
 
 #%% Settings
 
-import io, sys
+import io, os, sys
 from os import path as osp
 import logging
+import json
 
-from collections import OrderedDict, Mapping, Sequence#analysis:ignore
+from collections import OrderedDict, namedtuple#analysis:ignore
+from collections.abc import Mapping, Sequence
 import functools, itertools
 from six import string_types
 from uuid import uuid4
 
+import time
+import threading
+from datetime import timedelta
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
 import zipfile
+import requests
 
 import numpy as np#analysis:ignore
 import pandas as pd#analysis:ignore
@@ -90,6 +101,7 @@ except ImportError:
 else:
     # logging.warning('\n! geopy help: http://geopy.readthedocs.io/en/latest/ !')
     _is_geopy_installed = True
+    from geopy import exc as geoexc
     # from geopy import geocoders
     #CODERS.update({'GoogleV3':'api_key', 'Bing':'api_key', 'GeoNames':'username',
     #               'Yandex':'api_key', 'MapQuest':'key', 'Nominatim':None,
@@ -111,8 +123,19 @@ else:
     _is_pyproj_installed = True
     from pyproj import CRS as crs, Transformer
 
+try:
+    import pyarrow as pa
+except ImportError:
+    _is_pyarrow_installed = False
+else:
+    _is_pyarrow_installed = True
+    import pyarrow.parquet as pq
+
 from pyeudatnat import PACKNAME, COUNTRIES
-from pyeudatnat.misc import FileSys
+from pyeudatnat.misc import FileSys, RateLimiter
+from pyeudatnat.io import File, Frame
+from pyeudatnat.io import DEF_CHUNKSIZE
+from pyeudatnat.text import TextProcess
 
 __CODERS        = { }
 CODERS          = __CODERS                                                           \
@@ -127,12 +150,39 @@ CODERS          = __CODERS
                              'Nominatim':       None, # using Nominatim with the default geopy is strongly discouraged
                              'OpenMapQuest':    'api_key'} if _is_geopy_installed else {})      \
                     or __CODERS # at the end, CODERS will be equal to __CODERS after its updates
+CODERS.update({'Gazetteer': 'index'}) # offline geocoder, see Gazetteer
 
 # default geocoder... but this can be reset when declaring a subclass
 DEF_CODER       = {'Nominatim': None} # {'Bing' : None}
 
 DEF_AGENT       = PACKNAME
 
+RATES           = {'GISCO':           1,
+                   'osm':             1,
+                   'Nominatim':       1, # see https://operations.osmfoundation.org/policies/nominatim/
+                   'GoogleV3':        50,
+                   'Bing':            5,
+                   'GeoNames':        1,
+                   'Yandex':          10,
+                   'MapQuest':        10,
+                   'OpenMapQuest':    1}
+"""Default maximum number of requests per second sent to the geocoders.
+"""
+
+DEF_RATE        = 1
+DEF_WORKERS     = 1
+DEF_RETRIES     = 3
+DEF_BACKOFF     = 1. # in seconds, doubled at each retry
+
+TRANSIENTS      = (ConnectionError, TimeoutError,                               \
+                   requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+if _is_geopy_installed:
+    TRANSIENTS += (geoexc.GeocoderTimedOut, geoexc.GeocoderUnavailable)         \
+        + ((geoexc.GeocoderRateLimited,) if hasattr(geoexc, 'GeocoderRateLimited') else ())
+"""Errors upon which geocoding requests are retried, i.e. network and timeout errors
+only: other (e.g., local) failures are not retried.
+"""
+
 DRIVERS         = {gdal.GetDriver(i).ShortName: gdal.GetDriver(i).LongName
                    for i in range(gdal.GetDriverCount())}
 
@@ -150,6 +200,44 @@ DEF_PLACE       = ['street', 'number', 'postcode', 'city', 'country']
 """Fields used to defined a toponomy (location/place).
 """
 
+DEF_GEOCACHE    = 'geocache.sqlite'
+"""Default name of the on-disk geocoding cache.
+"""
+
+DEF_GAZETTEER   = 'gazetteer.parquet'
+"""Default name of the on-disk index of the offline geocoder.
+"""
+
+CENTROID_FIELDS = {'cc':        ['cc', 'cntr_id', 'cntr_code', 'country'],
+                   'postcode':  ['postcode', 'pc', 'pc_cntr', 'post_code', 'postal_code', 'zip'],
+                   'lau':       ['lau', 'lau_id', 'lau_code', 'gisco_id'],
+                   'lat':       ['lat', 'latitude', 'y'],
+                   'lon':       ['lon', 'lng', 'longitude', 'x']
+                   }
+"""Names (case insensitive) of the columns of the tables of postcode/LAU centroids
+(e.g., GISCO postal codes).
+"""
+
+GEO_QUALITY     = {'address':   1,
+                   'postcode':  2,
+                   'lau':       3,
+                   'unknown':   -1
+                   }
+"""Quality of the geolocation ('geo_qual' field), following the way the coordinates
+were retrieved.
+"""
+
+GAZETTEER_FIELDS = {'street':   ['street', 'road', 'thoroughfare'],
+                    'number':   ['number', 'housenumber', 'house_number', 'hnr'],
+                    'postcode': ['postcode', 'zip', 'zipcode', 'postal_code', 'post_code'],
+                    'city':     ['city', 'locality', 'town', 'municipality'],
+                    'lat':      ['lat', 'latitude', 'y'],
+                    'lon':      ['lon', 'lng', 'longitude', 'x']
+                    }
+"""Names (case insensitive) of the columns of address/gazetteer dumps (e.g., from
+OpenAddresses or GISCO) used to build the index of an offline geocoder.
+"""
+
 #%% Core functions/classes
 
 #==============================================================================
@@ -204,6 +292,471 @@ def isoCountry(arg):
     return {'code': cc, 'name': country}
 
 
+#==============================================================================
+# Class Cache
+#==============================================================================
+
+class Cache(object):
+    """Persistent on-disk cache of geocoded places, stored in a SQLite database
+    and keyed on the pair (coder, normalised place).
+
+        >>> geocache = Cache(store = None, expire = 0, force = False)
+
+    Arguments
+    ---------
+    store : str
+        directory (or SQLite file) where the cache is stored; default: the
+        directory returned by :meth:`File.default_cache`.
+    expire : int, timedelta
+        expiration time (in seconds) of the cached places, with the same semantics
+        as for :class:`io.Cache`: `None` or negative values mean no expiration,
+        0 means that nothing is ever retrieved from the cache (though nothing is
+        evicted by :meth:`clean` either).
+    force : bool
+        flag set to ignore cached places, that are nevertheless updated.
+    """
+
+    TABLE       = 'geocode'
+    MAXVARS     = 500 # chunk size for bulk operations (SQLITE_MAX_VARIABLE_NUMBER >= 999)
+
+    #/************************************************************************/
+    def __init__(self, store=None, expire=None, force=False):
+        if store in (None,''):
+            store = File.default_cache()
+        elif not isinstance(store, string_types):
+            raise TypeError("Wrong format for cache STORE '%s' - must be a string" % store)
+        if osp.isdir(store) or osp.splitext(store)[1] == '':
+            store = osp.join(store, DEF_GEOCACHE)
+        if isinstance(expire, timedelta):
+            expire = expire.total_seconds()
+        elif not (expire is None or isinstance(expire, (int,float))):
+            raise TypeError("Wrong format for cache EXPIRE - must be a number or a timedelta")
+        os.makedirs(osp.dirname(osp.abspath(store)), exist_ok = True)
+        self.store, self.expire, self.force = store, expire, force
+        with closing(self.connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS %s "
+                         "(coder TEXT, place TEXT, lat REAL, lon REAL, time REAL, "
+                         "PRIMARY KEY (coder, place)) WITHOUT ROWID" % self.TABLE)
+
+    #/************************************************************************/
+    def connect(self):
+        return sqlite3.connect(self.store, timeout = 60)
+
+    #/************************************************************************/
+    def lookup(self, coder, places):
+        """Bulk retrieval of (non expired) cached places.
+
+            >>> coords = geocache.lookup(coder, places)
+
+        Returns
+        -------
+        coords : dict
+            dictionary of the (lat, lon) coordinates indexed by the places found
+            in the cache.
+        """
+        if self.force is True or self.expire == 0:
+            return {}
+        if isinstance(places, string_types):
+            places = [places,]
+        places = list(set(places))
+        query = "SELECT place, lat, lon FROM %s WHERE coder = ? AND place IN (%s)"
+        params = [coder]
+        if self.expire is not None and self.expire > 0:
+            query += " AND time > ?"
+            params = [coder, time.time() - self.expire]
+        coords = {}
+        with closing(self.connect()) as conn:
+            for i in range(0, len(places), self.MAXVARS):
+                chunk = places[i:i+self.MAXVARS]
+                rows = conn.execute(query % (self.TABLE, ','.join('?' * len(chunk))),
+                                    [params[0]] + chunk + params[1:])
+                coords.update({place: (lat, lon) for (place, lat, lon) in rows})
+        return coords
+
+    #/************************************************************************/
+    def insert(self, coder, coords):
+        """Bulk insertion of geocoded places: places already cached are updated.
+
+            >>> geocache.insert(coder, coords)
+
+        Arguments
+        ---------
+        coords : dict
+            dictionary of the (lat, lon) coordinates indexed by the places.
+        """
+        now = time.time()
+        rows = [(coder, place, float(lat), float(lon), now)
+                for (place, (lat, lon)) in coords.items()]
+        if rows == []:
+            return
+        with closing(self.connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO %s VALUES (?, ?, ?, ?, ?)" % self.TABLE,
+                             rows)
+
+    #/************************************************************************/
+    def clean(self, expire=None):
+        """Remove the expired places from the cache, like :meth:`io.Cache.prune`
+        does with the expired entries.
+
+            >>> geocache.clean(expire = None)
+
+        Keyword arguments
+        -----------------
+        expire : int, timedelta
+            expiration time (in seconds); default: that of the cache; only positive
+            values evict places.
+        """
+        expire = self.expire if expire is None else expire
+        if isinstance(expire, timedelta):
+            expire = expire.total_seconds()
+        if expire is None or expire <= 0:
+            return
+        with closing(self.connect()) as conn, conn:
+            conn.execute("DELETE FROM %s WHERE time <= ?" % self.TABLE,
+                         (time.time() - expire,))
+
+
+#==============================================================================
+# Class Gazetteer
+#==============================================================================
+
+class Gazetteer(object):
+    """Offline geocoder backed by a local index of addresses, where the canonical
+    keys of the places (see :meth:`text.TextProcess.normalise`) are sorted together
+    with their coordinates.
+
+        >>> gazetteer = Gazetteer(index, cc = None)
+
+    Arguments
+    ---------
+    index : str
+        Parquet file of the index, as built by :meth:`build`\ .
+    cc : str
+        country code of the normalisation of the places; default: the one used to
+        build the index.
+    """
+
+    LOCATION    = namedtuple('Location', ['latitude', 'longitude'])
+
+    #/************************************************************************/
+    def __init__(self, index, cc=None):
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise ImportError("Package pyarrow not installed - Gazetteer not available")
+        if not isinstance(index, string_types):
+            raise TypeError("Wrong format for gazetteer INDEX '%s' - must be a string" % index)
+        elif not osp.exists(index):
+            raise IOError("Gazetteer index '%s' not found" % index)
+        table = pq.read_table(index, memory_map = True)
+        try:
+            meta = json.loads(table.schema.metadata[b'gazetteer'])
+        except:
+            meta = {}
+        self.cc = cc or meta.get('cc')
+        self.fields = meta.get('fields') or []
+        self.keys = table.column('key').to_numpy(zero_copy_only = False).astype(object)
+        coords = np.column_stack([table.column('lat').to_numpy(), table.column('lon').to_numpy()])
+        if not pd.Index(self.keys).is_monotonic_increasing:
+            order = np.argsort(self.keys, kind = 'stable')
+            self.keys, coords = self.keys[order], coords[order]
+        self.coords = coords
+        # prefix sums of the coordinates: centroids of contiguous ranges of keys
+        self.__cumsum = np.vstack([[0., 0.], np.cumsum(coords, axis = 0)])
+        self.__index = pd.Index(self.keys)
+        self.stats = {}
+
+    #/************************************************************************/
+    def __len__(self):
+        return len(self.keys)
+
+    #/************************************************************************/
+    @staticmethod
+    def make_keys(df, fields=None, cc=None):
+        """Build the canonical keys of the places described in the columns of a
+        dataframe.
+
+            >>> keys = Gazetteer.make_keys(df, fields = None, cc = None)
+
+        Keyword arguments
+        -----------------
+        fields : dict
+            columns of the fields of the places, in the order of :data:`DEF_PLACE`;
+            default: the columns named after the fields.
+        """
+        if fields is None:
+            fields = {f: f for f in DEF_PLACE if f in df.columns}
+        data = df[list(dict.fromkeys(fields.values()))].copy()
+        if 'postcode' in fields:
+            data[fields['postcode']] = \
+                TextProcess.normalise_postcode(data[fields['postcode']], cc = cc).to_numpy()
+        return TextProcess.normalise(TextProcess.join_columns(data, delim = ', '), cc = cc)
+
+    #/************************************************************************/
+    @classmethod
+    def build(cls, src, dest=None, columns=None, cc=None, **kwargs):
+        """Build the index of an offline geocoder from an address or gazetteer dump,
+        e.g. an OpenAddresses or GISCO export in CSV or Parquet; places with identical
+        keys are merged into their centroid.
+
+            >>> gazetteer = Gazetteer.build(src, dest = None, columns = None, cc = None,
+                                            chunksize = DEF_CHUNKSIZE, **kwargs)
+
+        Keyword arguments
+        -----------------
+        dest : str
+            Parquet file of the index; default: the source with a '.parquet' extension,
+            or :data:`DEF_GAZETTEER` in the default cache directory.
+        columns : dict
+            columns of the fields of the places ('street', 'number', 'postcode',
+            'city') and of the coordinates ('lat', 'lon'); default: the columns
+            named as in :data:`GAZETTEER_FIELDS`\ .
+        cc : str
+            country code of the normalisation of the places (see :meth:`make_keys`).
+        chunksize : int
+            number of rows read at once; default: :data:`io.DEF_CHUNKSIZE`\ .
+
+        Other keyword arguments are passed to :meth:`io.Frame.from_data`\ .
+        """
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise ImportError("Package pyarrow not installed - Gazetteer not available")
+        if dest in (None,''):
+            if isinstance(src, string_types) and osp.splitext(src)[1].lower() != '.parquet':
+                dest = '%s.parquet' % osp.splitext(src)[0]
+            else:
+                dest = osp.join(File.default_cache(), DEF_GAZETTEER)
+        kwargs.update({'chunksize': kwargs.pop('chunksize', None) or DEF_CHUNKSIZE})
+        chunks = Frame.from_data(src, **kwargs)
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks,]
+        keys, coords = [], []
+        for chunk in chunks:
+            if columns is None: # match the names once, on the first chunk
+                names = {c.lower(): c for c in chunk.columns}
+                columns = {f: next((names[n] for n in alias if n in names), None)
+                           for (f, alias) in GAZETTEER_FIELDS.items()}
+                columns = {f: c for (f, c) in columns.items() if c is not None}
+            try:
+                assert 'lat' in columns and 'lon' in columns
+                fields = {f: columns[f] for f in DEF_PLACE if f in columns}
+                assert fields != {}
+            except AssertionError:
+                raise IOError("Gazetteer columns not found in source - set COLUMNS")
+            keys.append(cls.make_keys(chunk, fields, cc = cc).to_numpy())
+            coords.append(np.column_stack([pd.to_numeric(chunk[columns['lat']], errors = 'coerce'),
+                                           pd.to_numeric(chunk[columns['lon']], errors = 'coerce')]))
+        try:
+            assert sum([len(k) for k in keys]) > 0
+        except AssertionError:
+            raise IOError("No place found in gazetteer source")
+        df = pd.DataFrame(np.vstack(coords), columns = ['lat', 'lon'])
+        df['key'] = np.concatenate(keys)
+        df = (df.dropna()
+              .groupby('key', sort = True, observed = True)[['lat', 'lon']].mean()
+              .reset_index())
+        table = pa.Table.from_pandas(df[['key', 'lat', 'lon']], preserve_index = False)
+        meta = {'cc': cc, 'fields': list(fields.keys())}
+        table = table.replace_schema_metadata(dict(table.schema.metadata or {},
+                                                   gazetteer = json.dumps(meta)))
+        os.makedirs(osp.dirname(osp.abspath(dest)), exist_ok = True)
+        pq.write_table(table, dest, compression = 'zstd')
+        logging.warning("\n! Gazetteer index of %s places written in '%s' !" % (len(df), dest))
+        return cls(dest, cc = cc)
+
+    #/************************************************************************/
+    def lookup(self, places, prefix=True, normalise=True):
+        """Batch geocoding of places: exact matches of the keys are looked up in
+        a hash table; the other places are matched with the keys they prefix (field
+        by field), e.g. a street without number and city, and located at the centroid
+        of these keys.
+
+            >>> coords = gazetteer.lookup(places, prefix = True, normalise = True)
+
+        Keyword arguments
+        -----------------
+        prefix : bool
+            flag set to run the prefix lookups; default: `True`.
+        normalise : bool
+            flag set to normalise the places into keys; set it to `False` when the
+            places are already keys; default: `True`.
+
+        Returns
+        -------
+        coords : np.ndarray
+            (n,2) array of the (lat, lon) coordinates of the places, NaN when not found.
+        """
+        if isinstance(places, string_types):
+            places = [places,]
+        keys = TextProcess.normalise(places, cc = self.cc) if normalise is True \
+            else pd.Series(places, dtype = object)
+        keys = keys.to_numpy(dtype = object)
+        coords = np.full((len(keys), 2), np.nan)
+        pos = self.__index.get_indexer(keys)
+        exact = pos >= 0
+        coords[exact] = self.coords[pos[exact]]
+        nprefix = 0
+        miss = np.flatnonzero(~exact & pd.notna(keys))
+        if prefix is True and len(miss) > 0 and len(self.keys) > 0:
+            # keys starting with the place followed by a field delimiter
+            starts = np.array([k + ',' for k in keys[miss]], dtype = object)
+            ends = np.array([k + ',\U0010ffff' for k in keys[miss]], dtype = object)
+            lo = np.searchsorted(self.keys, starts, side = 'left')
+            hi = np.searchsorted(self.keys, ends, side = 'left')
+            found = hi > lo
+            lo, hi, miss = lo[found], hi[found], miss[found]
+            coords[miss] = (self.__cumsum[hi] - self.__cumsum[lo]) / (hi - lo)[:,None]
+            nprefix = len(miss)
+        self.stats = {'places': len(keys), 'exact': int(exact.sum()), 'prefix': nprefix}
+        return coords
+
+    #/************************************************************************/
+    def geocode(self, place, **kwargs):
+        """Geocoding of a single place, with the same interface as the online
+        geocoders.
+
+            >>> loc = gazetteer.geocode(place)
+        """
+        lat, lon = self.lookup([place,])[0]
+        return None if np.isnan(lat) else self.LOCATION(float(lat), float(lon))
+
+
+#==============================================================================
+# Class Centroid
+#==============================================================================
+
+class Centroid(object):
+    """In-memory lookup tables of the centroids of postcodes and LAUs (local
+    administrative units), per country, used to locate the places that could not
+    be geocoded; the instances retrieved with :meth:`Centroid.get` are loaded once
+    and shared.
+
+        >>> centroids = Centroid(src, columns = None, cc = None, **kwargs)
+
+    Arguments
+    ---------
+    src : str
+        table (CSV, Parquet, ...) of the centroids, with the country code (when
+        several countries are present), the postcode and/or the LAU code, and the
+        coordinates of the centroids, see :data:`CENTROID_FIELDS`\ .
+    columns : dict
+        columns of the fields 'cc', 'postcode', 'lau', 'lat' and 'lon'; default:
+        the columns named as in :data:`CENTROID_FIELDS`\ .
+    cc : str
+        country code of the table when it has no country column.
+
+    Other keyword arguments are passed to :meth:`io.Frame.from_data`\ .
+    """
+
+    __TABLES    = {}
+    __LOCK      = threading.Lock()
+
+    #/************************************************************************/
+    @classmethod
+    def get(cls, src, **kwargs):
+        """Retrieve the centroids loaded from a given source with given options,
+        loading them if needed.
+
+            >>> centroids = Centroid.get(src, **kwargs)
+        """
+        if isinstance(src, Centroid):
+            return src
+        key = (osp.abspath(src) if isinstance(src, string_types) else src,
+               repr(sorted(kwargs.items()))) # e.g., other columns, other country
+        with cls.__LOCK:
+            centroids = cls.__TABLES.get(key)
+            if centroids is None:
+                centroids = cls.__TABLES[key] = cls(src, **kwargs)
+        return centroids
+
+    #/************************************************************************/
+    def __init__(self, src, columns=None, cc=None, **kwargs):
+        df = Frame.from_data(src, **kwargs)
+        if columns is None:
+            names = {c.lower(): c for c in df.columns}
+            columns = {f: next((names[n] for n in alias if n in names), None)
+                       for (f, alias) in CENTROID_FIELDS.items()}
+            columns = {f: c for (f, c) in columns.items() if c is not None}
+        try:
+            assert 'lat' in columns and 'lon' in columns
+            assert 'postcode' in columns or 'lau' in columns
+        except AssertionError:
+            raise IOError("Centroid columns not found in source - set COLUMNS")
+        coords = np.column_stack([pd.to_numeric(df[columns['lat']], errors = 'coerce'),
+                                  pd.to_numeric(df[columns['lon']], errors = 'coerce')])
+        ccs = df[columns['cc']].astype(str).str.upper().to_numpy() if 'cc' in columns \
+            else np.full(len(df), cc, dtype = object)
+        self.tables = {}
+        for kind in ('postcode', 'lau'):
+            if kind not in columns:
+                continue
+            for c in pd.unique(ccs):
+                rows = np.flatnonzero(ccs == c)
+                codes = self._codes(df[columns[kind]].iloc[rows], kind, c)
+                table = (pd.DataFrame(coords[rows], columns = ['lat', 'lon'])
+                         .assign(code = codes)
+                         .dropna()
+                         .groupby('code', sort = False)[['lat', 'lon']].mean())
+                self.tables.update({(kind, c): (table.index, table.to_numpy())})
+
+    #/************************************************************************/
+    @staticmethod
+    def _codes(codes, kind, cc):
+        # canonical postcodes (see TextProcess.normalise_postcode), or LAU codes
+        if kind == 'postcode':
+            return TextProcess.normalise_postcode(codes, cc = cc).to_numpy()
+        codes = pd.Series(codes).astype('string').str.strip().str.upper()
+        return codes.astype(object).where(codes.notna() & (codes != ''), np.nan).to_numpy()
+
+    #/************************************************************************/
+    def lookup(self, codes, kind='postcode', cc=None):
+        """Vectorised retrieval of the centroids of postcodes or LAUs.
+
+            >>> coords = centroids.lookup(codes, kind = 'postcode', cc = None)
+
+        Returns
+        -------
+        coords : np.ndarray
+            (n,2) array of the (lat, lon) coordinates of the centroids, NaN when not found.
+        """
+        try:
+            assert kind in ('postcode', 'lau')
+        except AssertionError:
+            raise IOError("Wrong KIND of centroids - must be 'postcode' or 'lau'")
+        table = self.tables.get((kind, cc)) or self.tables.get((kind, None))
+        if table is None:
+            ccs = [c for (k, c) in self.tables.keys() if k == kind]
+            if cc is None and ccs != []:
+                raise IOError("No country code CC parsed - centroids of %ss are set per country '%s'"
+                              % (kind, ccs))
+            elif ccs != []:
+                logging.warning("\n! No centroids of %ss available for country '%s' !" % (kind, cc))
+            table = (pd.Index([]), np.empty((0, 2)))
+        index, coords = table
+        pos = index.get_indexer(self._codes(codes, kind, cc))
+        return np.vstack([coords, [np.nan, np.nan]])[pos] # -1 picks the last row
+
+    #/************************************************************************/
+    def fill(self, lat, lon, postcodes=None, laus=None, cc=None):
+        """Fill the missing coordinates with the centroids of the postcodes, then
+        of the LAUs, in one vectorised pass, and return the quality of the locations
+        (see :data:`GEO_QUALITY`).
+
+            >>> lat, lon, qual = centroids.fill(lat, lon, postcodes = None, laus = None, cc = None)
+        """
+        lat = np.array(lat, dtype = float)
+        lon = np.array(lon, dtype = float)
+        qual = np.where(np.isnan(lat) | np.isnan(lon), GEO_QUALITY['unknown'], GEO_QUALITY['address'])
+        for kind, codes in (('postcode', postcodes), ('lau', laus)):
+            miss = np.flatnonzero(qual == GEO_QUALITY['unknown'])
+            if codes is None or len(miss) == 0:
+                continue
+            coords = self.lookup(np.asarray(codes)[miss], kind = kind, cc = cc)
+            found = ~np.isnan(coords).any(axis = 1)
+            miss = miss[found]
+            lat[miss], lon[miss], qual[miss] = coords[found,0], coords[found,1], GEO_QUALITY[kind]
+        return lat, lon, qual
+
+
 #==============================================================================
 # Class Service
 #==============================================================================
@@ -310,17 +863,42 @@ class Service(object):
 
     #/************************************************************************/
     def __init__(self, *args,  **kwargs):
-        try:
-            assert _is_happy_installed is True or _is_geopy_installed is True
-        except:
-            raise ImportError("No instance of '%s' available" % self.__class__)
+        geoclient = kwargs.pop('geoclient', None)
         if not args in ((),(None,)):
             coder = args[0]
         else:
             coder = kwargs.pop('coder', DEF_CODER) # None
+        try:
+            assert geoclient is not None or _is_happy_installed is True or _is_geopy_installed is True \
+                or self.get_client(coder)['coder'] == 'Gazetteer'
+        except:
+            raise ImportError("No instance of '%s' available" % self.__class__)
         # exactly_one = kwargs.pop('exactly_one',None)
         self.agent = kwargs.pop('user_agent', DEF_AGENT)
+        self.cache = kwargs.pop('cache', None)
+        cc = kwargs.pop('cc', None) # country of the places, used by offline geocoders
+        self.crs, self.proj = None, None # no use
+        self.stats = {}
+        if geoclient is not None:
+            # any client with a 'geocode' method, e.g. a local/offline geocoder
+            try:
+                assert callable(getattr(geoclient, 'geocode', None))
+            except AssertionError:
+                raise TypeError("Wrong geocoder client - must implement a 'geocode' method")
+            if isinstance(coder, string_types):
+                coder = {'coder': coder}
+            elif isinstance(coder, Mapping) and not 'coder' in coder:
+                coder = {'coder': list(coder.keys())[0]}
+            self.client, self.geoclient = coder, geoclient
+            return
         self.client = self.get_client(coder)
+        if self.client['coder'] == 'Gazetteer': # offline geocoder
+            if isinstance(self.client.get('index'), Gazetteer):
+                self.geoclient = self.client.pop('index')
+            else:
+                self.geoclient = Gazetteer(self.client.get('index') or osp.join(File.default_cache(), DEF_GAZETTEER),
+                                           cc = cc)
+            return
         coder = self.client['coder'].lower()
         try:
             assert _is_happy_installed is True
@@ -345,7 +923,6 @@ class Service(object):
                 self.geoclient = services.GISCOService()
             else:
                 self.geoclient = services.APIService(**self.client)
-        self.crs, self.proj = None, None # no use
 
     #/************************************************************************/
     def __getattr__(self, attr):
@@ -367,6 +944,22 @@ class Service(object):
             raise TypeError("Wrong format for geocoder user AGENT '%s' - must be a string" % agent)
         self.__agent = agent
 
+    #/************************************************************************/
+    @property
+    def cache(self):
+        return self.__cache
+    @cache.setter#analysis:ignore
+    def cache(self, cache):
+        if cache is True:
+            cache = Cache()
+        elif cache is False:
+            cache = None
+        elif isinstance(cache, string_types):
+            cache = Cache(cache)
+        elif not (cache is None or isinstance(cache, Cache)):
+            raise TypeError("Wrong format for geocoding CACHE '%s' - must be a Cache instance or a string" % cache)
+        self.__cache = cache
+
     #/************************************************************************/
     @property
     def client(self):
@@ -420,6 +1013,163 @@ class Service(object):
         except:
             return (np.nan, np.nan)
 
+    #/************************************************************************/
+    def locate_retry(self, place, limiter=None, retries=DEF_RETRIES, backoff=DEF_BACKOFF):
+        """Throttled geocoding of a single place, retried with exponential backoff
+        upon transient errors (see :data:`TRANSIENTS`).
+
+            >>> lat, lon = geoserv.locate_retry(place, limiter = None, retries = 3, backoff = 1.)
+        """
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                loc = self.geoclient.geocode(place)
+            except TRANSIENTS:
+                if attempt == retries:
+                    break
+                time.sleep(backoff * 2**attempt)
+            except:
+                break
+            else:
+                try:    return loc.latitude, loc.longitude
+                except: break # not found
+        return (np.nan, np.nan)
+
+    #/************************************************************************/
+    def locate_pool(self, places, **kwargs):
+        """Geocoding of a list of places through a pool of concurrent workers
+        sharing the rate limit of the geocoder.
+
+            >>> coords = geoserv.locate_pool(places, workers = 1, rate = None, retries = 3, backoff = 1.)
+
+        Keyword arguments
+        -----------------
+        workers : int
+            number of requests in flight; default: :data:`DEF_WORKERS`\ .
+        rate : float
+            maximum number of requests per second; default: the geocoder rate
+            in :data:`RATES`\ , or :data:`DEF_RATE`; `False` or 0 to disable
+            the limitation.
+        shared : bool
+            flag set to share the rate limit with all the processes running on
+            the host (*e.g.*, parallel pipelines using the same geocoder); default:
+            `True`.
+        retries, backoff :
+            see :meth:`locate_retry`\ .
+
+        Returns
+        -------
+        coords : list
+            (lat, lon) coordinates of the places, in the same order.
+        """
+        workers = kwargs.pop('workers', None) or DEF_WORKERS
+        try:
+            assert isinstance(workers, int) and workers > 0
+        except AssertionError:
+            raise TypeError("Wrong format for WORKERS '%s' - must be a positive integer" % workers)
+        coder = self.client['coder']
+        rate = kwargs.pop('rate', None)
+        if rate is None:
+            rate = RATES.get(coder, DEF_RATE)
+        limiter = RateLimiter.get(('geocode', coder), rate = rate or None,
+                                  burst = kwargs.pop('burst', 1),
+                                  shared = kwargs.pop('shared', True))
+        locate = functools.partial(self.locate_retry, limiter = limiter,
+                                   retries = kwargs.pop('retries', DEF_RETRIES),
+                                   backoff = kwargs.pop('backoff', DEF_BACKOFF))
+        if workers == 1 or len(places) <= 1:
+            return [locate(place) for place in places]
+        with ThreadPoolExecutor(max_workers = min(workers, len(places))) as executor:
+            return list(executor.map(locate, places)) # map preserves the order
+
+    #/************************************************************************/
+    def _locate_unique(self, places, keys, **kwargs):
+        # geocode a list of distinct places; return a (n,2) array of lat/lon;
+        # when a cache is set, only the places missing in it are geocoded
+        local = kwargs.pop('local', None) # keys of the places in the gazetteer
+        if isinstance(self.geoclient, Gazetteer): # offline: faster than the cache
+            coords = self.geoclient.lookup(places) if local is None \
+                else self.geoclient.lookup(local, normalise = False)
+            self.stats.update({'cached': 0, 'geocoded': len(places)})
+            self.stats.update({k: v for (k, v) in self.geoclient.stats.items() if k != 'places'})
+            return coords
+        coords = np.full((len(places), 2), np.nan)
+        if self.cache is not None:
+            coder = self.client['coder']
+            cached = self.cache.lookup(coder, keys)
+            hit = np.array([k in cached for k in keys], dtype = bool)
+            if hit.any():
+                coords[hit] = [cached[k] for k in keys[hit]]
+        else:
+            hit = np.zeros(len(places), dtype = bool)
+        miss = np.flatnonzero(~hit)
+        if len(miss) > 0:
+            coords[miss] = np.array(self.locate_pool(places[miss], **kwargs),
+                                    dtype = float).reshape(-1, 2)
+        if self.cache is not None:
+            found = miss[~np.isnan(coords[miss]).any(axis=1)]
+            self.cache.insert(coder, dict(zip(keys[found], coords[found])))
+        self.stats.update({'cached': int(hit.sum()), 'geocoded': len(miss)})
+        return coords
+
+    #/************************************************************************/
+    def locate_batch(self, places, **kwargs):
+        """Batch geocoding method: every distinct place is geocoded only once
+        and the resulting coordinates are broadcast back to all the entries.
+
+            >>> lat, lon = geoserv.locate_batch(places, keys = None, **kwargs)
+
+        Keyword arguments
+        -----------------
+        keys : list
+            canonical keys used to identify identical places; when not set, these
+            are computed through :meth:`TextProcess.normalise`.
+        local : list
+            keys of the same places built as those of the offline gazetteer (see
+            :meth:`Gazetteer.make_keys`), used instead of the places when looking
+            them up in the gazetteer.
+        workers, rate, burst, shared, retries, backoff :
+            see :meth:`locate_pool`\ .
+        """
+        if isinstance(places, string_types):
+            places = [places,]
+        try:
+            assert isinstance(places, (Sequence, np.ndarray, pd.Series, pd.Index))
+        except AssertionError:
+            raise TypeError("Wrong type of PLACES - must be a sequence of strings")
+        places = np.asarray(places, dtype = object)
+        keys = kwargs.pop('keys', None)
+        if keys is None:
+            keys = TextProcess.normalise(places)
+        try:
+            assert len(keys) == len(places)
+        except AssertionError:
+            raise IOError("Mismatched lengths of PLACES and KEYS")
+        local = kwargs.pop('local', None)
+        try:
+            assert local is None or len(local) == len(places)
+        except AssertionError:
+            raise IOError("Mismatched lengths of PLACES and LOCAL places")
+        # identify the distinct places (-1 for missing ones), and pick for each
+        # of them its first occurrence as the actual query
+        codes, uniques = pd.factorize(np.asarray(keys, dtype = object))
+        valid = np.flatnonzero(codes >= 0)
+        _, first = np.unique(codes[valid], return_index = True)
+        first = valid[first]
+        self.stats = {}
+        if local is not None:
+            kwargs.update({'local': np.asarray(local, dtype = object)[first]})
+        coords = self._locate_unique(places[first], np.asarray(uniques), **kwargs)
+        # broadcast back: the extra last row (NaN, NaN) is picked by missing places
+        coords = np.vstack([coords, [np.nan, np.nan]])[codes]
+        nplaces, nqueries = len(places), len(first)
+        self.stats.update({'places': nplaces, 'queries': nqueries,
+                           'dedup': 1. - nqueries / nplaces if nplaces else 0.})
+        logging.warning("\n! %s unique geocoding queries for %s places (dedup ratio: %.1f%%) - %s retrieved from cache !"
+                        % (nqueries, nplaces, 100 * self.stats['dedup'], self.stats.get('cached', 0)))
+        return coords[:,0], coords[:,1]
+
     #/************************************************************************/
     def project(self, *coord, **kwargs):
         """Projection method.
@@ -473,6 +1223,177 @@ class Service(object):
                 return (np.nan, np.nan)
 
 
+    #/************************************************************************/
+    @staticmethod
+    @functools.lru_cache(maxsize = 32)
+    def get_transformer(iproj, oproj):
+        """Build (once) the transformer between two projections: the transformer
+        is cached for every pair (iproj, oproj).
+
+            >>> transformer = Service.get_transformer(iproj, oproj)
+
+        Note
+        ----
+        Coordinates are always handled in the (x, y) order, i.e. (lon, lat) for
+        geographic projections.
+        """
+        try:
+            assert _is_pyproj_installed is True
+        except:
+            raise ImportError("No projection transformer available")
+        return Transformer.from_crs(crs.from_user_input(iproj),
+                                    crs.from_user_input(oproj),
+                                    always_xy = True)
+
+    #/************************************************************************/
+    @classmethod
+    def project_batch(cls, lat, lon, iproj, oproj='WGS84'):
+        """Vectorised projection of arrays of coordinates: missing or invalid
+        coordinates are returned as NaN.
+
+            >>> nlat, nlon = Service.project_batch(lat, lon, iproj, oproj = 'WGS84')
+
+        Returns
+        -------
+        nlat, nlon : np.ndarray
+            projected coordinates, i.e. (y, x) when :data:`oproj` is not a
+            geographic projection.
+        """
+        lat = pd.to_numeric(pd.Series(np.asarray(lat, dtype = object).ravel()),
+                            errors = 'coerce').to_numpy(dtype = float)
+        lon = pd.to_numeric(pd.Series(np.asarray(lon, dtype = object).ravel()),
+                            errors = 'coerce').to_numpy(dtype = float)
+        try:
+            assert len(lat) == len(lon)
+        except AssertionError:
+            raise IOError("Mismatched lengths of LAT and LON coordinates")
+        if iproj == oproj:
+            return lat, lon
+        transformer = cls.get_transformer(iproj, oproj)
+        nlat, nlon = np.full(len(lat), np.nan), np.full(len(lon), np.nan)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+        if valid.any():
+            nlon[valid], nlat[valid] = transformer.transform(lon[valid], lat[valid])
+        # failed transformations are returned as inf by pyproj
+        nlat[~np.isfinite(nlat)], nlon[~np.isfinite(nlon)] = np.nan, np.nan
+        return nlat, nlon
+
+
+#==============================================================================
+# Class Resolver
+#==============================================================================
+
+class Resolver(Service):
+    """Tiered geocoding: a chain of geocoders run in cost order, where every tier
+    only receives the places that the previous tiers could not resolve, namely:
+    the persistent cache, the local gazetteer (see :class:`Gazetteer`), the free
+    remote geocoders, and finally the paid (keyed) ones.
+
+        >>> resolver = Resolver(tiers, cache = None, sort = True, **kwargs)
+
+    Arguments
+    ---------
+    tiers : list
+        geocoders of the tiers (e.g., :literal:`[{'Gazetteer': index}, 'Nominatim',
+        {'Bing': key}]`), see :meth:`Service.get_client`; geocoders that are not
+        available are ignored.
+    cache : bool, str, Cache
+        persistent geocoding cache, looked up first for the places geocoded by any
+        of the remote tiers.
+    sort : bool
+        flag set to sort the tiers by cost (see :meth:`cost`), otherwise they are
+        run in the given order; default: `True`.
+
+    Other keyword arguments are passed to the instantiation of the geocoders.
+    """
+
+    #/************************************************************************/
+    @staticmethod
+    def cost(client):
+        """Rank of a geocoder in the chain: 0 for the local gazetteer, 1 for the
+        free remote geocoders, and 2 for the paid ones, i.e. those requiring a key.
+        """
+        coder = client.get('coder')
+        if coder == 'Gazetteer':
+            return 0
+        keyed = CODERS.get(coder) is not None                               \
+            or any([v is not None for (k, v) in client.items() if k != 'coder'])
+        return 2 if keyed else 1
+
+    #/************************************************************************/
+    def __init__(self, tiers, cache=None, sort=True, **kwargs):
+        if isinstance(tiers, (string_types, Mapping, Service)):
+            tiers = [tiers,]
+        elif not isinstance(tiers, Sequence):
+            raise TypeError("Wrong format for geocoding TIERS - must be a list of geocoders")
+        services = []
+        for tier in tiers:
+            try:
+                services.append(tier if isinstance(tier, Service) else Service(tier, cache = None, **dict(kwargs)))
+            except:
+                logging.warning("\n! Geocoder '%s' not available - tier ignored !" % tier)
+        if sort is True:
+            services.sort(key = lambda serv: self.cost(serv.client)) # stable
+        self.geoclient = None
+        self.client = {'coder': 'Resolver'}
+        self.agent = kwargs.get('user_agent', DEF_AGENT)
+        self.cache = cache
+        self.crs, self.proj = None, None
+        self.services, self.stats = services, {}
+        try:
+            assert services != [] or self.cache is not None
+        except AssertionError:
+            raise IOError("No geocoding tier available")
+
+    #/************************************************************************/
+    def _locate_unique(self, places, keys, **kwargs):
+        # run the tiers over a list of distinct places: every tier is parsed the
+        # places still unresolved, and the places geocoded remotely are cached
+        local = kwargs.pop('local', None)
+        coords = np.full((len(places), 2), np.nan)
+        tiers = OrderedDict()
+        if self.cache is not None:
+            hit = np.zeros(len(places), dtype = bool)
+            for serv in self.services:
+                coder, miss = serv.client['coder'], np.flatnonzero(~hit)
+                if coder == 'Gazetteer' or len(miss) == 0:
+                    continue
+                cached = self.cache.lookup(coder, keys[miss])
+                found = miss[np.array([k in cached for k in keys[miss]], dtype = bool)]
+                if len(found) > 0:
+                    coords[found] = [cached[k] for k in keys[found]]
+                    hit[found] = True
+            tiers.update({'cache': int(hit.sum())})
+        for serv in self.services:
+            coder = name = serv.client['coder']
+            if name in tiers:
+                name = '%s#%s' % (coder, len(tiers))
+            miss = np.flatnonzero(np.isnan(coords).any(axis = 1))
+            if len(miss) == 0:
+                tiers.update({name: 0})
+                continue
+            res = serv._locate_unique(places[miss], keys[miss],
+                                      local = None if local is None else local[miss], **dict(kwargs))
+            found = ~np.isnan(res).any(axis = 1)
+            coords[miss[found]] = res[found]
+            tiers.update({name: int(found.sum())})
+            if self.cache is not None and coder != 'Gazetteer':
+                self.cache.insert(coder, dict(zip(keys[miss[found]], res[found])))
+        unresolved = int(np.isnan(coords).any(axis = 1).sum())
+        self.stats.update({'cached': tiers.get('cache', 0), 'tiers': dict(tiers),
+                           'unresolved': unresolved})
+        logging.warning("\n! Geocoding tiers: %s - %s place(s) unresolved !"
+                        % (', '.join(['%s: %s' % t for t in tiers.items()]), unresolved))
+        return coords
+
+    #/************************************************************************/
+    def locate_apply(self, place):
+        assert isinstance(place, string_types)
+        keys = TextProcess.normalise([place,]).to_numpy()
+        lat, lon = self._locate_unique(np.array([place,], dtype = object), keys)[0]
+        return lat, lon
+
+
 #==============================================================================
 # Class Vector
 #==============================================================================
@@ -14,16 +14,19 @@
 .. |chardet| replace:: `chardet <chardet_>`_
 .. _xmltree: https://docs.python.org/3/library/xml.etree.elementtree.html
 .. |xmltree| replace:: `xml.tree <xmltree_>`_
+.. _pyarrow: https://arrow.apache.org/docs/python/
+.. |pyarrow| replace:: `pyarrow <pyarrow_>`_
 
 Module implementing miscenalleous Input/Output methods.
 
 **Dependencies**
 
 *require*:      :mod:`os`, :mod:`six`, :mod:`collections`, :mod:`numpy`, :mod:`pandas`,
-                :mod:`time`, :mod:`requests`, :mod:`hashlib`, :mod:`shutil`
+                :mod:`time`, :mod:`requests`, :mod:`urllib`, :mod:`hashlib`, :mod:`shutil`, :mod:`threading`,
+                :mod:`sqlite3`, :mod:`concurrent.futures`, :mod:`csv`
 
 *optional*:     :mod:`simplejson`, :mod:`json`, :mod:`geojson`, :mod:`zipfile`, :mod:`bs4`,
-                :mod:`datetime`, :mod:`chardet`, :mod:`xml.etree`
+                :mod:`datetime`, :mod:`chardet`, :mod:`xml.etree`, :mod:`pyarrow`, :mod:`pyproj`
 
 *call*:         :mod:`pyeudatnat.misc`
 
@@ -45,12 +48,19 @@ from six import string_types
 
 import time
 try:
-    from datetime import datetime
+    from datetime import datetime, timedelta
 except ImportError:
     pass
+from uuid import uuid4
+import sqlite3
 
 import numpy as np
 import pandas as pd
+try: # public since pandas 2.2
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    try:                from pandas._libs.tslibs.parsing import guess_datetime_format
+    except ImportError: guess_datetime_format = None
 
 try:
     import geopandas as gpd
@@ -65,9 +75,37 @@ except:
 else:
     _is_geopandas_installed = True
 
+try:
+    import pyarrow as pa
+except ImportError:
+    #logging.warning('\n! missing pyarrow package (visit https://arrow.apache.org/docs/python/ !')
+    _is_pyarrow_installed = False
+else:
+    _is_pyarrow_installed = True
+    import pyarrow.parquet as pq
+    import pyarrow.feather as pf
+    import pyarrow.compute as pc
+    import pyarrow.dataset as pds
+    import pyarrow.csv as pcsv
+    import pyarrow.fs#analysis:ignore
+
+try:
+    import pyproj
+except ImportError:
+    _is_pyproj_installed = False
+else:
+    _is_pyproj_installed = True
+
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+
 import requests # urllib2
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
 import hashlib
 import shutil
+import threading
+import csv
 
 try:
     import simplejson as json
@@ -103,7 +141,10 @@ try:
     import chardet
 except ImportError:
     #logging.warning('\n! missing chardet package (visit https://pypi.org/project/chardet/ !')
-    pass
+    _is_chardet_installed = False
+else:
+    _is_chardet_installed = True
+    from chardet.universaldetector import UniversalDetector
 
 try:
     import geojson#analysis:ignore
@@ -124,6 +165,7 @@ else:
 
 from pyeudatnat import PACKNAME
 from pyeudatnat.misc import Object, Structure, FileSys#analysis:ignore
+from pyeudatnat.misc import RateLimiter
 from pyeudatnat.misc import DEF_DATETIMEFMT
 
 FORMATS         = { 'csv':          'csv',
@@ -135,6 +177,11 @@ FORMATS         = { 'csv':          'csv',
                     'sql':          'sql',
                     'sas':          'sas',
                     'geojson':      'geojson',
+                    'geojsonseq':   'geojsonl',
+                    'parquet':      'parquet',
+                    'geoparquet':   'geoparquet',
+                    'feather':      'feather',
+                    'arrow':        'arrow',
                     'topojson':     'topojson',
                     'shapefile':    'shp',
                     'geopackage':   'gpkg',
@@ -146,6 +193,63 @@ DEF_FORMATS     = ['csv', 'json', 'excel', 'table', 'xls', 'html', 'geojson', 's
 DEF_FORMAT      = 'csv'
 DEF_INFER_FORMAT = False # DEF_FORMAT
 
+CHUNK_FORMATS   = ['csv', 'table', 'parquet', 'geoparquet', 'feather', 'arrow'] # formats read lazily, chunk by chunk
+APPEND_FORMATS  = ['csv', 'geojsonl'] # formats that can be written chunk by chunk
+DUMP_FORMATS    = ['csv', 'json', 'xls', 'geojson', 'geojsonl', 'gpkg',
+                   'parquet', 'geoparquet', 'feather', 'arrow'] # formats that can be written
+ARROW_FORMATS   = ['parquet', 'geoparquet', 'feather', 'arrow'] # columnar formats
+
+ARROW_TYPES     = { 'str':      'string',
+                    'int':      'int64',
+                    'float':    'float64',
+                    'bool':     'bool',
+                    'datetime': 'timestamp[us]'
+                    }
+"""Arrow types of the columns, following the types of the template index.
+"""
+DEF_COMPRESSION = {'parquet': 'snappy', 'feather': 'lz4'}
+
+CSV_ENGINES     = ['pandas', 'pyarrow'] # engines reading/writing CSV data
+DEF_CSV_ENGINE  = 'pandas'
+
+UNPARSED_KWARGS = ['caching', 'cache_store', 'cache_expire', 'cache_force', 'parse_cache',
+                   'timeout', 'pool', 'download', 'workers', 'progress']
+"""Options that do not change the parsed dataframe, hence ignored in the keys of
+the parse cache.
+"""
+
+DEF_PRECISION   = 6 # number of decimals of the coordinates written in GeoJSON
+DEF_BATCHSIZE   = 10000 # number of features encoded at once when writing GeoJSON
+GEOJSON_KWARGS  = ['columns', 'latlon', 'seq', 'precision', 'batchsize', 'mode',
+                   'encoding', 'enc', 'ensure_ascii']
+
+DEF_SNIFFSIZE   = 16 * 1024 # size (in bytes) of the head sample used to detect formats
+DEF_CONFIDENCE  = 0.5 # minimum confidence for a detected format to be read first, also when not a candidate
+
+SIGNATURES      = { b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1': 'xls', # OLE2 compound document
+                    b'\x00\x00\x27\x0a':         'shp', # shapefile main file code 9994
+                    b'SQLite format 3\x00':     'gpkg',
+                    b'PAR1':                    'parquet',
+                    b'ARROW1':                  'arrow', # Arrow IPC file, i.e. Feather V2
+                    b'FEA1':                    'feather'
+                    }
+"""Magic bytes identifying binary formats at the head of the data.
+"""
+
+CONTENT_TYPES   = { 'text/csv':                 'csv',
+                    'application/csv':          'csv',
+                    'text/tab-separated-values':'table',
+                    'application/json':         'json',
+                    'application/geo+json':     'geojson',
+                    'application/vnd.geo+json': 'geojson',
+                    'application/vnd.ms-excel': 'xls',
+                    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xls',
+                    'application/geopackage+sqlite3': 'gpkg',
+                    'text/html':                'html',
+                    'application/xml':          'xml',
+                    'text/xml':                 'xml'
+                    }
+
 ENCODINGS       = { 'utf-8':       'utf-8',
                     'latin':       'ISO-8859-1',
                     'ISO-8859-1':  'ISO-8859-1',
@@ -155,9 +259,35 @@ ENCODINGS       = { 'utf-8':       'utf-8',
 DEF_ENCODING    = 'utf-8' # 'latin'
 
 DEF_SEP         = ';'
+SEPARATORS      = [';', ',', '\t', '|']
+
+DEF_CHUNKSIZE   = 100000 # number of rows
+
+DEF_DATESAMPLE  = 100 # number of distinct values used to infer date formats
+DEF_CARDINALITY = 0.5 # maximum ratio of distinct values for a column to be cast value by value
+DEF_CATEGORIES  = 0.1 # maximum ratio of distinct values for a text column to be stored as categorical
 
 PROTOCOLS       = ['http', 'https', 'ftp']
 
+DEF_TIMEOUT     = 60 # in seconds
+DEF_POOLSIZE    = 10 # number of connections kept alive per host
+DEF_BLOCKSIZE   = 1024**2 # size (in bytes) of the blocks written/read on disk
+DEF_RETRIES     = 3
+
+HOST_RATES      = {}
+"""Default maximum number of requests per second sent to the hosts, shared by
+all the processes running on the machine (see :meth:`Requests.limit`); hosts not
+listed are not limited.
+"""
+
+DEF_CACHE_BUDGET = 2 * 1024**3 # maximum size (in bytes) of the cache store
+
+VALIDATORS      = {'ETag':          'If-None-Match',
+                   'Last-Modified': 'If-Modified-Since'}
+"""Response headers stored with cached contents, and the request headers used
+to revalidate them.
+"""
+
 COMPRESSIONS    = ['zip', 'gz', 'gzip', 'bz2']
 
 #%% Core functions/classes
@@ -193,8 +323,9 @@ class File(object):
             assert fmt is None or isinstance(fmt, string_types)  \
                 or (isinstance(fmt, Sequence) and all([isinstance(f, string_types) for f in fmt]))
         except: raise IOError("Wrong format for FMT parameter: '%s'" % fmt)
-        if fmt is None:                             fmt = DEF_FORMATS
+        if fmt is None:                             fmt = list(DEF_FORMATS)
         elif isinstance(fmt, string_types):         fmt = [fmt,]
+        else:                                       fmt = list(fmt)
         try:
             assert isinstance(infer_fmt, bool) or isinstance(infer_fmt, string_types) \
                 or (isinstance(infer_fmt, Sequence) and all([isinstance(f, string_types) for f in infer_fmt]))
@@ -216,6 +347,219 @@ class File(object):
             fmt = [fmt,]
         return fmt
 
+    #/************************************************************************/
+    @staticmethod
+    def head_sample(data, size=DEF_SNIFFSIZE):
+        """Retrieve the first bytes of some data (file on disk, bytes, string or
+        stream) with no side effect: streams are rewound after reading.
+
+            >>> head = File.head_sample(data, size = DEF_SNIFFSIZE)
+        """
+        head = None
+        if isinstance(data, bytes):
+            head = data[:size]
+        elif isinstance(data, string_types):
+            if any([data.startswith(p) for p in PROTOCOLS]):
+                pass # no peeking into remote sources
+            elif osp.isfile(data):
+                with open(data, 'rb') as f:
+                    head = f.read(size)
+            else: # the content itself
+                head = data[:size].encode('utf-8')
+        else:
+            try:
+                assert data.seekable()
+                pos = data.tell()
+                head = data.read(size)
+                data.seek(pos)
+            except:
+                try:    head = data.peek(size)[:size] # e.g. buffered stream
+                except: pass
+            if isinstance(head, string_types):
+                head = head.encode('utf-8')
+        return head
+
+    #/************************************************************************/
+    @staticmethod
+    def sniff_format(data, src=None, ctype=None, size=DEF_SNIFFSIZE):
+        """Detect the format of some data from its magic bytes, its extension, its
+        content-type and a sample of its head, so that a single reader is used.
+
+            >>> fmt, confidence = File.sniff_format(data, src = None, ctype = None, size = DEF_SNIFFSIZE)
+
+        Keyword arguments
+        -----------------
+        src : str
+            name of the source, whose extension is used as a hint; default: :data:`data`
+            when it is a filename.
+        ctype : str
+            content-type of the source (e.g., the header of an HTTP response).
+
+        Returns
+        -------
+        fmt : str
+            format of the data, as a key of the readers in :meth:`Frame.from_data`,
+            or `None` when no format is recognised.
+        confidence : float
+            confidence in the detection, between 0 and 1; detections relying on the
+            extension or the content-type only score below :data:`DEF_CONFIDENCE`\ .
+        """
+        hints = []
+        if src is None and isinstance(data, string_types) and len(data) < 1024:
+            src = data
+        try:
+            ext = osp.splitext(src)[-1].replace('.','').lower()
+            assert ext != ''
+            hints.append(File.check_format(ext)[0])
+        except: pass
+        try:
+            hints.append(CONTENT_TYPES[ctype.split(';')[0].strip().lower()])
+        except: pass
+        hint = hints[0] if hints != [] else None
+        def _confidence(fmt, score):
+            if fmt in hints:    return min(1., score + 0.1)
+            elif hints != []:   return score - 0.1
+            else:               return score
+        head = File.head_sample(data, size = size)
+        if head in (None, b''):
+            return hint, 0.4 if hint is not None else 0. # hint only
+        # binary formats
+        for magic, fmt in SIGNATURES.items():
+            if head.startswith(magic):
+                return fmt, _confidence(fmt, 0.9)
+        if head.startswith(b'PK\x03\x04'): # zip archive: spreadsheet (OOXML) or else
+            if b'[Content_Types].xml' in head or b'xl/' in head:
+                return 'xls', _confidence('xls', 0.9)
+            return hint, 0.3 if hint is not None else 0.
+        if head.startswith(b'\x1f\x8b'): # gzip: let the readers decompress
+            return hint, 0.4 if hint is not None else 0.
+        # text formats
+        for bom in (b'\xef\xbb\xbf', b'\xff\xfe', b'\xfe\xff'):
+            if head.startswith(bom):
+                head = head[len(bom):]
+                break
+        text = head.decode('utf-8', errors='replace').lstrip()
+        if text.startswith('{') or text.startswith('['):
+            if '"Topology"' in text:
+                return 'topojson', _confidence('topojson', 0.9)
+            elif '"FeatureCollection"' in text or '"Feature"' in text:
+                return 'geojson', _confidence('geojson', 0.9)
+            return 'json', _confidence('json', 0.8)
+        elif text.startswith('<'):
+            if text[:1024].lower().find('<html') >= 0 or text[:15].lower().startswith('<!doctype html'):
+                return 'html', _confidence('html', 0.8)
+            return 'xml', _confidence('xml', 0.8)
+        lines = text.splitlines()
+        if len(lines) > 1 and len(head) >= size:
+            lines = lines[:-1] # last line of the sample may be truncated
+        lines = [l for l in lines if l.strip() != ''][:50]
+        try:
+            dialect = csv.Sniffer().sniff('\n'.join(lines), delimiters=''.join(SEPARATORS))
+        except:
+            return hint or DEF_FORMAT, 0.3 if hint is None else 0.4
+        fmt = 'table' if dialect.delimiter == '\t' else 'csv'
+        nfields = set([len(r) for r in csv.reader(lines, dialect)])
+        score = 0.8 if len(lines) > 1 and len(nfields) == 1 else 0.6
+        return fmt, _confidence(fmt, score)
+
+    #/************************************************************************/
+    @staticmethod
+    def sniff_encoding(head, size=DEF_SNIFFSIZE):
+        """Detect the encoding of some bytes, feeding at most :data:`size` of them
+        to an incremental detector.
+
+            >>> enc = File.sniff_encoding(head, size = DEF_SNIFFSIZE)
+        """
+        head = head[:size]
+        for bom, enc in ((b'\xef\xbb\xbf', 'utf-8-sig'), (b'\xff\xfe', 'utf-16'), (b'\xfe\xff', 'utf-16')):
+            if head.startswith(bom):
+                return enc
+        try:
+            head.decode('utf-8')
+        except UnicodeDecodeError as e:
+            if e.start >= len(head) - 3: # multibyte character cut by the sample
+                return 'utf-8'
+        else:
+            return 'utf-8'
+        enc = None
+        if _is_chardet_installed is True:
+            detector = UniversalDetector()
+            for i in range(0, len(head), 4096):
+                detector.feed(head[i:i+4096])
+                if detector.done:   break
+            detector.close()
+            if (detector.result.get('confidence') or 0) >= 0.5:
+                enc = detector.result.get('encoding')
+        if enc in (None, 'ascii'):
+            enc = ENCODINGS['latin']
+        return enc
+
+    #/************************************************************************/
+    @staticmethod
+    def sniff_dialect(data, size=DEF_SNIFFSIZE, encoding=None, header=False):
+        """Infer the options needed to parse CSV data (encoding, delimiter, quote
+        character, decimal mark and, on demand, header row) from a bounded sample
+        of its head, so that the detection time does not depend on the size of the
+        data.
+
+            >>> opts = File.sniff_dialect(data, size = DEF_SNIFFSIZE, encoding = None, header = False)
+
+        Keyword arguments
+        -----------------
+        header : bool
+            flag set to also infer whether the first row is a header; this is not
+            reliable (*e.g.*, headers made of years are taken for data), hence
+            pandas' own inference is kept by default; default: `False`.
+
+        Returns
+        -------
+        opts : dict
+            options to be passed to :meth:`pandas.read_csv`, among 'encoding', 'sep',
+            'quotechar', 'decimal' and 'header'; empty when nothing can be inferred.
+        """
+        head = File.head_sample(data, size = size)
+        if head in (None, b'') or b'\x00' in head[:1024]:
+            return {} # no sample, or binary data
+        opts = {}
+        if encoding is None:
+            encoding = File.sniff_encoding(head, size = size)
+            if not (isinstance(data, io.TextIOBase)
+                    or (isinstance(data, string_types) and not osp.isfile(data))):
+                opts.update({'encoding': encoding})
+        text = head.decode(encoding, errors='ignore')
+        lines = text.splitlines()
+        if len(lines) > 1 and len(head) >= size:
+            lines = lines[:-1] # last line of the sample may be truncated
+        lines = [l for l in lines if l.strip() != ''][:50]
+        sample = '\n'.join(lines)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=''.join(SEPARATORS))
+        except:
+            return opts
+        opts.update({'sep': dialect.delimiter, 'quotechar': dialect.quotechar})
+        rows = list(csv.reader(lines, dialect))
+        isnum = lambda f, d: f.strip().lstrip('-+').replace(d, '', 1).isdigit() and d in f
+        if dialect.delimiter != ',':
+            commas = sum([isnum(f, ',') for r in rows[1:] for f in r])
+            points = sum([isnum(f, '.') for r in rows[1:] for f in r])
+            if commas > points:
+                opts.update({'decimal': ','})
+        if header is not True:
+            return opts
+        try:
+            header = csv.Sniffer().has_header(sample)
+        except:
+            header = True
+        try:
+            assert header is False
+            # the first row is considered as data only when it contains numbers
+            assert any([f.strip().lstrip('-+').replace(opts.get('decimal','.'), '', 1).isdigit()
+                        for f in rows[0]])
+        except:     pass
+        else:
+            opts.update({'header': None})
+        return opts
+
     #/************************************************************************/
     @staticmethod
     def default_cache():
@@ -286,6 +630,46 @@ class File(object):
         """
         return [x for i, x in enumerate(file) if i in lines]
 
+    #/************************************************************************/
+    @staticmethod
+    def extract_cache(zf, members, file, store=None):
+        """Extract members of a zip archive into the cache store, where they
+        keep their names (so that companion files, e.g. of shapefiles, remain
+        together); members already extracted from the same archive are reused.
+
+            >>> paths = File.extract_cache(zf, members, file, store = None)
+        """
+        cache = Cache(store)
+        try: # identify the archive by its location and version, also when opened...
+            path = file if isinstance(file, string_types) else getattr(file, 'name', None)
+            assert isinstance(path, string_types) and osp.isfile(path)
+            archive = '%s:%s:%s' % (osp.abspath(path), os.stat(path).st_mtime, os.stat(path).st_size)
+        except: # ... or by its content, when streamed
+            md5 = hashlib.md5()
+            if hasattr(file, 'getbuffer'):
+                md5.update(file.getbuffer())
+            else:
+                pos = file.tell()
+                file.seek(0)
+                for block in iter(lambda: file.read(DEF_BLOCKSIZE), b''):
+                    md5.update(block)
+                file.seek(pos)
+            archive = md5.hexdigest()
+        root = osp.join(cache.store, 'extract', hashlib.md5(archive.encode('utf-8')).hexdigest())
+        results = {}
+        for m in members:
+            key = 'zip:%s!%s' % (archive, m)
+            entry = cache.get(key)
+            if entry is None:
+                tmp = '%s.%s' % (cache.tmp(key), uuid4().hex)
+                zf.extract(m, path = tmp)
+                os.makedirs(osp.dirname(osp.join(root, m)), exist_ok = True)
+                os.replace(osp.join(tmp, m), osp.join(root, m))
+                shutil.rmtree(tmp, ignore_errors = True)
+                entry = {'path': cache.add(key, osp.join(root, m))}
+            results.update({m: entry['path']})
+        return results
+
     #/************************************************************************/
     @staticmethod
     def unzip(file, **kwargs):
@@ -296,7 +680,8 @@ class File(object):
         try:
             assert zipfile.is_zipfile(file)
         except:     raise IOError("Zip file '%s' not recognised" % file)
-        path = kwargs.pop('path') if 'path' in kwargs else File.default_cache()
+        # members are extracted into the cache store, unless a path is parsed
+        path, store = kwargs.pop('path', None), kwargs.pop('store', None)
         operators = [op for op in ['open', 'extract', 'extractall', 'getinfo', 'namelist', 'read', 'infolist'] \
                      if op in kwargs.keys()]
         try:
@@ -325,7 +710,7 @@ class File(object):
                 return infolist if len(infolist)>1 else infolist[0]
             elif operator == 'extractall':
                 if members in (None,True):  members = namelist
-                return zf.extractall(path = path, members = members)
+                return zf.extractall(path = path or File.default_cache(), members = members)
             if members is None and len(namelist)==1:
                 members = namelist
             elif members is not None:
@@ -351,50 +736,726 @@ class File(object):
             if members in ([],None):
                 raise IOError("Impossible to retrieve member file(s) from zipped data")
             nkw = Object.inspect_kwargs(kwargs, getattr(zf, operator))
-            if operator == 'extract':
-                nkw.update({'path': path})
-            results = {m: getattr(zf, operator)(m, **nkw) for m in members}
+            if operator == 'extract' and path is None:
+                results = File.extract_cache(zf, members, file, store = store)
+            else:
+                if operator == 'extract':
+                    nkw.update({'path': path})
+                results = {m: getattr(zf, operator)(m, **nkw) for m in members}
         return results
         # raise IOError("Operation '%s' failed" % operator)
 
 
+#==============================================================================
+# Class Cache
+#==============================================================================
+
+class Cache(object):
+    """Content-addressed on-disk cache store, bounded in size, with an index of
+    the entries stored in a SQLite database.
+
+        >>> cache = Cache(store = None, budget = DEF_CACHE_BUDGET, expire = None)
+
+    Arguments
+    ---------
+    store : str
+        directory of the cache store; default: :meth:`File.default_cache`\ .
+    budget : int
+        maximum total size (in bytes) of the store; the least recently used
+        entries are evicted beyond it; `None` means no limitation.
+    expire : int
+        default expiration time (in seconds) of the entries, with the same
+        semantics as for :meth:`File.is_cached`\ .
+
+    Note
+    ----
+    Contents are stored (once) under their SHA-256 digest in the 'objects'
+    directory, while extracted archive members keep their names in the 'extract'
+    directory. Files are always written to a temporary location first, then
+    atomically renamed.
+    """
+
+    INDEX       = 'index.sqlite'
+    STATS       = ['hits', 'misses', 'revalidated', 'bytes_read', 'bytes_written',
+                   'evicted', 'bytes_evicted']
+    PARSE_STATS = ['parsed_hits', 'parsed_misses'] # see Frame.from_file
+
+    #/************************************************************************/
+    def __init__(self, store=None, budget=DEF_CACHE_BUDGET, expire=None):
+        if isinstance(store, Cache):
+            store, budget, expire = store.store, store.budget, store.expire
+        elif store in (None,''):
+            store = File.default_cache()
+        elif not isinstance(store, string_types):
+            raise TypeError("Wrong format for cache STORE '%s' - must be a string" % store)
+        if not (budget is None or isinstance(budget, int)):
+            raise TypeError("Wrong format for cache BUDGET '%s' - must be an integer" % budget)
+        self.store, self.budget, self.expire = osp.abspath(store), budget, expire
+        [os.makedirs(osp.join(self.store, d), exist_ok = True) for d in ('objects', 'extract', 'tmp')]
+        with closing(self.connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS entries "
+                         "(key TEXT PRIMARY KEY, path TEXT, size INTEGER, ctime REAL, "
+                         "atime REAL, meta TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER)")
+            conn.executemany("INSERT OR IGNORE INTO stats VALUES (?, 0)",
+                             [(s,) for s in self.STATS + self.PARSE_STATS])
+
+    #/************************************************************************/
+    def connect(self):
+        return sqlite3.connect(osp.join(self.store, self.INDEX), timeout = 60)
+
+    #/************************************************************************/
+    def _count(self, conn, **counts):
+        conn.executemany("UPDATE stats SET value = value + ? WHERE name = ?",
+                         [(v, k) for (k,v) in counts.items()])
+
+    #/************************************************************************/
+    @property
+    def stats(self):
+        """Statistics of the store (hits, misses, bytes, ...), with the number
+        of entries and the current size.
+        """
+        with closing(self.connect()) as conn:
+            stats = {k: v for (k, v) in conn.execute("SELECT name, value FROM stats")
+                     if k in self.STATS}
+            nentries, size = conn.execute("SELECT COUNT(*), TOTAL(size) FROM "
+                                          "(SELECT path, MAX(size) AS size FROM entries GROUP BY path)"
+                                          ).fetchone()
+        stats.update({'entries': nentries, 'size': int(size)})
+        return stats
+
+    #/************************************************************************/
+    @property
+    def parse_stats(self):
+        """Statistics of the parsed dataframes stored in the cache (hits and misses),
+        kept apart from those of the raw contents.
+        """
+        with closing(self.connect()) as conn:
+            return {k: v for (k, v) in conn.execute("SELECT name, value FROM stats")
+                    if k in self.PARSE_STATS}
+
+    #/************************************************************************/
+    def tmp(self, key, suffix=''):
+        """Return a temporary pathname in the store associated to a key.
+        """
+        return osp.join(self.store, 'tmp', '%s%s' % (hashlib.md5(key.encode('utf-8')).hexdigest(), suffix))
+
+    #/************************************************************************/
+    def entry(self, key):
+        """Retrieve the description of an entry, whether expired or not, without
+        updating statistics.
+
+            >>> entry = cache.entry(key)
+
+        Returns
+        -------
+        entry : dict
+            dictionary with keys 'path', 'size', 'ctime', 'atime' and 'meta', or
+            `None` when the key is not in the store.
+        """
+        with closing(self.connect()) as conn:
+            row = conn.execute("SELECT path, size, ctime, atime, meta FROM entries WHERE key = ?",
+                               (key,)).fetchone()
+        if row is None or not osp.exists(osp.join(self.store, row[0])):
+            return None
+        return {'path': osp.join(self.store, row[0]), 'size': row[1],
+                'ctime': row[2], 'atime': row[3], 'meta': json.loads(row[4] or '{}')}
+
+    #/************************************************************************/
+    def get(self, key, expire=None):
+        """Retrieve a valid (i.e., not expired) entry and record the access.
+
+            >>> entry = cache.get(key, expire = None)
+
+        Returns
+        -------
+        entry : dict
+            see :meth:`entry`; `None` when missing or expired.
+        """
+        expire = self.expire if expire is None else expire
+        entry = self.entry(key)
+        now = time.time()
+        valid = entry is not None and (expire is None or expire < 0                 \
+                                       or (expire > 0 and now - entry['ctime'] < expire))
+        with closing(self.connect()) as conn, conn:
+            if valid:
+                conn.execute("UPDATE entries SET atime = ? WHERE key = ?", (now, key))
+                self._count(conn, hits = 1, bytes_read = entry['size'])
+            else:
+                self._count(conn, misses = 1)
+        return entry if valid else None
+
+    #/************************************************************************/
+    def put(self, key, data, meta=None, move=True):
+        """Store a content in the cache.
+
+            >>> path = cache.put(key, data, meta = None, move = True)
+
+        Arguments
+        ---------
+        data : bytes, str, file, iterable
+            content to store, parsed as bytes, as the name of a file (moved into
+            the store when :data:`move` is set, copied otherwise), as a file-like
+            object, or as an iterable of blocks of bytes.
+        meta : dict
+            additional (JSON serialisable) information stored with the entry.
+
+        Returns
+        -------
+        path : str
+            path of the stored content.
+        """
+        h = hashlib.sha256()
+        tmp = '%s.%s' % (self.tmp(key), uuid4().hex)
+        if isinstance(data, string_types):
+            with open(data, 'rb') as f:
+                for block in iter(lambda: f.read(DEF_BLOCKSIZE), b''):
+                    h.update(block)
+            if move is True:
+                os.replace(data, tmp)
+            else:
+                shutil.copyfile(data, tmp)
+        else:
+            if isinstance(data, (bytes,bytearray)):
+                blocks = [data]
+            elif hasattr(data, 'read'):
+                blocks = iter(lambda: data.read(DEF_BLOCKSIZE), b'')
+            else:
+                blocks = data
+            with open(tmp, 'wb') as f:
+                for block in blocks:
+                    h.update(block)
+                    f.write(block)
+        digest = h.hexdigest()
+        path = osp.join('objects', digest[:2], digest)
+        os.makedirs(osp.join(self.store, 'objects', digest[:2]), exist_ok = True)
+        os.replace(tmp, osp.join(self.store, path)) # identical contents are stored once
+        return self._register(key, path, meta)
+
+    #/************************************************************************/
+    def add(self, key, pathname, meta=None):
+        """Register a file already written in the 'extract' directory of the store.
+
+            >>> path = cache.add(key, pathname, meta = None)
+        """
+        path = osp.relpath(osp.abspath(pathname), self.store)
+        try:
+            assert not path.startswith('..') and osp.exists(pathname)
+        except AssertionError:
+            raise IOError("File '%s' not found in the cache store" % pathname)
+        return self._register(key, path, meta)
+
+    #/************************************************************************/
+    def _register(self, key, path, meta=None):
+        now, size = time.time(), osp.getsize(osp.join(self.store, path))
+        with closing(self.connect()) as conn, conn:
+            old = conn.execute("SELECT path FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                         (key, path, size, now, now, json.dumps(meta or {})))
+            self._count(conn, bytes_written = size)
+            if old is not None and old[0] != path:
+                self._discard(conn, [old[0]])
+        self.prune(keep = key)
+        return osp.join(self.store, path)
+
+    #/************************************************************************/
+    def touch(self, key, meta=None):
+        """Refresh an entry (e.g., after revalidation) so that its expiration
+        delay restarts.
+
+            >>> cache.touch(key, meta = None)
+        """
+        now = time.time()
+        with closing(self.connect()) as conn, conn:
+            if meta is None:
+                conn.execute("UPDATE entries SET ctime = ?, atime = ? WHERE key = ?",
+                             (now, now, key))
+            else:
+                conn.execute("UPDATE entries SET ctime = ?, atime = ?, meta = ? WHERE key = ?",
+                             (now, now, json.dumps(meta), key))
+            self._count(conn, revalidated = 1)
+
+    #/************************************************************************/
+    def remove(self, key):
+        """Remove an entry from the store.
+
+            >>> cache.remove(key)
+        """
+        with closing(self.connect()) as conn, conn:
+            row = conn.execute("SELECT path FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if row is not None:
+                self._discard(conn, [row[0]])
+
+    #/************************************************************************/
+    def _discard(self, conn, paths):
+        # delete the files that are no longer referenced by any entry
+        for path in set(paths):
+            if conn.execute("SELECT 1 FROM entries WHERE path = ?", (path,)).fetchone():
+                continue
+            try:    os.remove(osp.join(self.store, path))
+            except: pass
+
+    #/************************************************************************/
+    def prune(self, expire=None, budget=None, keep=None):
+        """Evict the expired entries, then the least recently used ones until the
+        store fits in its size budget.
+
+            >>> nbytes = cache.prune(expire = None, budget = None, keep = None)
+
+        Arguments
+        ---------
+        expire, budget :
+            expiration time and size budget; default: those of the store.
+        keep : str
+            key of an entry never evicted.
+
+        Returns
+        -------
+        nbytes : int
+            number of bytes freed.
+        """
+        expire = self.expire if expire is None else expire
+        budget = self.budget if budget is None else budget
+        if isinstance(expire, timedelta):
+            expire = expire.total_seconds()
+        evicted = []
+        with closing(self.connect()) as conn, conn:
+            if expire is not None and expire > 0:
+                evicted.extend(conn.execute("SELECT path, size FROM entries WHERE ctime <= ? AND key != ?",
+                                            (time.time() - expire, keep or '')).fetchall())
+                conn.execute("DELETE FROM entries WHERE ctime <= ? AND key != ?",
+                             (time.time() - expire, keep or ''))
+            if budget is not None:
+                # identical contents shared by several entries are counted once
+                rows = conn.execute("SELECT path, MAX(size), MAX(atime), SUM(key = ?) FROM entries "
+                                    "GROUP BY path ORDER BY MAX(atime)", (keep or '',)).fetchall()
+                total = sum([row[1] for row in rows])
+                for (path, size, _, kept) in rows:
+                    if total <= budget:
+                        break
+                    elif kept:
+                        continue
+                    evicted.append((path, size))
+                    conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+                    total -= size
+            paths = dict(evicted)
+            self._discard(conn, list(paths.keys()))
+            self._count(conn, evicted = len(paths), bytes_evicted = sum(paths.values()))
+        return sum(paths.values())
+
+
+#==============================================================================
+# Class CachedResponse
+#==============================================================================
+
+class CachedResponse(requests.models.Response):
+    """HTTP response served from the cache store: the cached file is only opened
+    (and closed) when the content is accessed, so that no file handle is held by
+    the response.
+
+        >>> response = CachedResponse(pathname)
+    """
+
+    #/************************************************************************/
+    def __init__(self, pathname):
+        super(CachedResponse, self).__init__()
+        self.pathname = pathname
+
+    #/************************************************************************/
+    @property
+    def content(self):
+        if self._content is False:
+            with open(self.pathname, 'rb') as f:
+                self._content = f.read()
+            self._content_consumed = True
+        return self._content
+
+    #/************************************************************************/
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        if self._content is not False:
+            return super(CachedResponse, self).iter_content(chunk_size, decode_unicode)
+        def generate():
+            with open(self.pathname, 'rb') as f:
+                for block in iter(lambda: f.read(chunk_size or DEF_BLOCKSIZE), b''):
+                    yield block
+        chunks = generate()
+        if decode_unicode:
+            chunks = requests.utils.stream_decode_response_unicode(chunks, self)
+        return chunks
+
+
+#==============================================================================
+# Class Adapter
+#==============================================================================
+
+class Adapter(HTTPAdapter):
+    """HTTP adapter waiting, before any request is sent, for the rate limiter of
+    the target host (see :meth:`Requests.limit`).
+    """
+
+    #/************************************************************************/
+    def send(self, request, **kwargs):
+        limiter = Requests.limiter(request.url)
+        if limiter is not None:
+            limiter.acquire()
+        return super(Adapter, self).send(request, **kwargs)
+
+
 #==============================================================================
 # Class Requests
 #==============================================================================
 
 class Requests(object):
 
+    __SESSION   = None
+    __POOLSIZE  = None
+    __LOCK      = threading.Lock()
+
+    PROGRESS    = {}
+    """Progress counters of the downloads, indexed by URL.
+    """
+
+    RATES       = dict(HOST_RATES)
+    """Maximum number of requests per second (and burst) sent to the hosts,
+    indexed by host.
+    """
+
+    #/************************************************************************/
+    @classmethod
+    def session(cls, pool=None):
+        """Retrieve the HTTP session shared by all requests, with connections
+        kept alive (up to :data:`pool` per host) and compressed transfers.
+
+            >>> session = Requests.session(pool = DEF_POOLSIZE)
+        """
+        pool = pool or cls.__POOLSIZE or DEF_POOLSIZE
+        try:
+            assert isinstance(pool, int) and pool > 0
+        except:     raise TypeError("Wrong format for POOL size '%s' - must be a positive integer" % pool)
+        with cls.__LOCK:
+            if cls.__SESSION is None or pool != cls.__POOLSIZE:
+                session = requests.Session()
+                adapter = Adapter(pool_connections = pool, pool_maxsize = pool)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+                if cls.__SESSION is not None:
+                    cls.__SESSION.close()
+                cls.__SESSION, cls.__POOLSIZE = session, pool
+            return cls.__SESSION
+
+    #/************************************************************************/
+    @classmethod
+    def limit(cls, host, rate=None, burst=1):
+        """Limit the rate of the requests sent to a host; the limit is shared by
+        all the processes running on the machine, so that concurrent workers
+        never overshoot it altogether.
+
+            >>> Requests.limit(host, rate = None, burst = 1)
+
+        Arguments
+        ---------
+        host : str
+            host name (*e.g.*, :literal:`ec.europa.eu`) or any URL on the host.
+
+        Keyword arguments
+        -----------------
+        rate : float
+            maximum number of requests per second; `None` or non positive values
+            remove the limitation.
+        burst : int
+            maximum number of requests that can be sent at once.
+        """
+        try:
+            assert isinstance(host, string_types)
+        except:     raise TypeError("Wrong format for HOST '%s' - must be a string" % host)
+        host = (urlparse(host).hostname or host).lower()
+        with cls.__LOCK:
+            if rate is None or rate <= 0:
+                cls.RATES.pop(host, None)
+            else:
+                cls.RATES[host] = (rate, burst)
+
+    #/************************************************************************/
+    @classmethod
+    def limiter(cls, url):
+        """Retrieve the rate limiter of the host of a URL, if any.
+
+            >>> limiter = Requests.limiter(url)
+        """
+        host = (urlparse(url).hostname or '').lower()
+        rate = cls.RATES.get(host)
+        if rate is None:
+            return None
+        rate, burst = rate if isinstance(rate, Sequence) else (rate, 1)
+        return RateLimiter.get(('http', host), rate = rate, burst = burst, shared = True)
+
+    #/************************************************************************/
+    @staticmethod
+    def from_cache(url, pathname, headers=None):
+        """Build a response from a cached content; the response is backed by the
+        cached file, which is read only when the content is accessed (see
+        :class:`CachedResponse`).
+
+            >>> response = Requests.from_cache(url, pathname, headers = None)
+        """
+        response = CachedResponse(pathname)
+        response.status_code, response.url = 200, url
+        response.headers.update(headers or {})
+        return response
+
     #/************************************************************************/
     @staticmethod
-    def cache_response(url, force, store, expire):
-        # sequential implementation of cache_response
-        pathname = File.build_cache(url, store)
-        is_cached = File.is_cached(pathname, expire)
-        if force is True or is_cached is False or store in (None,False):
-            response = requests.get(url)
-            content = response.content
-            if store not in (None,False):
-                # write "content" to a given pathname
-                with open(pathname, 'wb') as f:
-                    f.write(content)
+    def cache_response(url, force, store, expire, timeout=DEF_TIMEOUT):
+        """Retrieve the response to a request from the cache store. Expired contents
+        are revalidated with the ETag/Last-Modified validators stored with them,
+        so that unchanged contents are not downloaded again.
+
+            >>> response, pathname = Requests.cache_response(url, force, store, expire)
+
+        Arguments
+        ---------
+        store : str, Cache
+            cache store, see :class:`Cache`\ .
+        """
+        if store in (None,False):
+            return Requests.session().get(url, timeout = timeout), None
+        cache = Cache(store)
+        entry = None if force is True else cache.get(url, expire)
+        if entry is not None:
+            # read "content" from the store
+            return Requests.from_cache(url, entry['path'], entry['meta']), entry['path']
+        entry = None if force is True else cache.entry(url)
+        validators = {} if entry is None else entry['meta']
+        headers = {VALIDATORS[k]: v for (k,v) in validators.items() if k in VALIDATORS}
+        response = Requests.session().get(url, headers = headers, timeout = timeout,
+                                          stream = True)
+        if response.status_code == 304 and headers != {}: # not modified
+            response.close()
+            cache.touch(url) # the expiration delay restarts
+            return Requests.from_cache(url, entry['path'], validators), entry['path']
+        elif response.ok:
+            # write "content" to the store, together with the validators
+            validators = Requests.get_validators(response)
+            with closing(response):
+                pathname = cache.put(url, response.iter_content(chunk_size = DEF_BLOCKSIZE),
+                                     meta = validators)
+            return Requests.from_cache(url, pathname, validators), pathname
+        return response, None
+
+    #/************************************************************************/
+    @staticmethod
+    def get_validators(response):
+        return {k: response.headers[k] for k in VALIDATORS if k in response.headers}
+
+    #/************************************************************************/
+    @staticmethod
+    def write_validators(response, pathname):
+        """Store the validators of a response alongside a file.
+
+            >>> validators = Requests.write_validators(response, pathname)
+        """
+        validators = Requests.get_validators(response)
+        if validators != {}:
+            with open('%s.headers' % pathname, 'w') as f:
+                json.dump(validators, f)
+        elif osp.exists('%s.headers' % pathname):
+            os.remove('%s.headers' % pathname)
+        return validators
+
+    #/************************************************************************/
+    @staticmethod
+    def write_stream(response, pathname, mode='wb', chunksize=DEF_BLOCKSIZE, progress=None):
+        """Write the content of a streamed response to disk, block by block.
+
+            >>> nbytes = Requests.write_stream(response, pathname, mode = 'wb',
+                                               chunksize = DEF_BLOCKSIZE, progress = None)
+
+        Arguments
+        ---------
+        progress : callable
+            function called with the number of bytes written after every block.
+        """
+        nbytes = 0
+        with open(pathname, mode) as f:
+            for block in response.iter_content(chunk_size = chunksize):
+                if not block:
+                    continue
+                f.write(block)
+                nbytes += len(block)
+                if progress is not None:
+                    progress(len(block))
+        return nbytes
+
+    #/************************************************************************/
+    @staticmethod
+    def download(url, dest=None, **kwargs):
+        """Download a (possibly large) file straight to disk: blocks are written
+        to a temporary '.part' file, resumed with HTTP Range requests after a
+        failure, verified, and atomically renamed (into the cache store when no
+        destination is set).
+
+            >>> pathname = Requests.download(url, dest = None, **kwargs)
+
+        Keyword arguments
+        -----------------
+        store : str, Cache
+            cache store used when :data:`dest` is not set, see :class:`Cache`\ .
+        expire, force :
+            an existing destination (or cache entry) is kept when it is still
+            valid (see :meth:`File.is_cached`) and :data:`force` is not set;
+            otherwise, it is revalidated with its stored validators.
+        size : int
+            expected size (in bytes); default: the size announced by the server.
+        checksum : str
+            expected checksum, in the form 'algo:hexdigest', e.g. 'sha256:...'.
+        chunksize : int
+            size of the blocks; default: :data:`DEF_BLOCKSIZE`\ .
+        retries : int
+            number of resumptions after a failure; default: :data:`DEF_RETRIES`\ .
+        progress : callable
+            function called with the numbers of bytes (downloaded, total) after
+            every block; progress is also reported in :data:`Requests.PROGRESS`\ .
+        timeout : float
+            see :data:`DEF_TIMEOUT`\ .
+
+        Returns
+        -------
+        pathname : str
+            path of the downloaded file.
+        """
+        cache = Cache(kwargs.pop('store', None)) if dest in (None,'') else None
+        size, checksum = kwargs.pop('size', None), kwargs.pop('checksum', None)
+        try:
+            assert checksum is None or (isinstance(checksum, string_types) and ':' in checksum)
+            algo, digest = checksum.split(':', 1) if checksum else (None, None)
+            assert algo is None or algo.lower() in hashlib.algorithms_available
+        except:     raise TypeError("Wrong format for CHECKSUM '%s' - must be 'algo:hexdigest'" % checksum)
+        chunksize = kwargs.pop('chunksize', DEF_BLOCKSIZE)
+        retries = kwargs.pop('retries', DEF_RETRIES)
+        progress, timeout = kwargs.pop('progress', None), kwargs.pop('timeout', DEF_TIMEOUT)
+        validators, entry = {}, None
+        if cache is not None:
+            if kwargs.get('force') is not True:
+                entry = cache.get(url, kwargs.get('expire', None))
+                if entry is not None:
+                    return entry['path']
+                entry = cache.entry(url)
+                validators = {} if entry is None else entry['meta']
+            part = cache.tmp(url, '.part')
         else:
-            # read "content" from a given pathname.
-            with open(pathname, 'rb') as f:
-                content = f.read()
-        return content, pathname
+            os.makedirs(osp.dirname(osp.abspath(dest)), exist_ok = True)
+            if osp.exists(dest) and kwargs.get('force') is not True:
+                if File.is_cached(dest, kwargs.get('expire', None)):
+                    return dest
+                try:
+                    with open('%s.headers' % dest, 'r') as f:
+                        validators = json.load(f)
+                except:     pass
+            part = '%s.part' % dest
+        counters = Requests.PROGRESS[url] = {'done': 0, 'total': size, 'resumed': 0}
+        def _progress(n):
+            counters['done'] += n
+            if progress is not None:
+                progress(counters['done'], counters['total'])
+        session = Requests.session()
+        for attempt in range(retries + 1):
+            offset = osp.getsize(part) if osp.exists(part) else 0
+            # no content encoding, so that ranges and sizes apply to the file itself
+            headers = {'Accept-Encoding': 'identity'}
+            if offset > 0:
+                headers.update({'Range': 'bytes=%s-' % offset})
+                try:
+                    with open('%s.headers' % part, 'r') as f:
+                        # resume only if the remote file is unchanged
+                        headers.update({'If-Range': list(json.load(f).values())[0]})
+                except:     pass
+            elif validators != {}:
+                headers.update({VALIDATORS[k]: v for (k,v) in validators.items() if k in VALIDATORS})
+            try:
+                with closing(session.get(url, headers = headers, timeout = timeout,
+                                         stream = True)) as response:
+                    if response.status_code == 304: # not modified: the expiration delay restarts
+                        if cache is not None:
+                            cache.touch(url)
+                            return entry['path']
+                        os.utime(dest)
+                        return dest
+                    elif response.status_code == 416 and offset > 0: # nothing left
+                        counters.update({'done': offset, 'total': offset})
+                        break
+                    response.raise_for_status()
+                    if response.status_code == 206:
+                        counters.update({'done': offset, 'resumed': counters['resumed'] + 1})
+                        mode = 'ab'
+                        try:
+                            total = int(response.headers['Content-Range'].split('/')[-1])
+                        except:
+                            total = None
+                    else: # 200: the whole file is (re)sent
+                        counters.update({'done': 0})
+                        mode = 'wb'
+                        try:
+                            total = int(response.headers['Content-Length'])
+                        except:
+                            total = None
+                        Requests.write_validators(response, part)
+                    counters.update({'total': size or total})
+                    Requests.write_stream(response, part, mode = mode,
+                                          chunksize = chunksize, progress = _progress)
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == retries:
+                    raise IOError("Download of '%s' failed - %s" % (url, e))
+                logging.warning("\n! Download of '%s' interrupted - resuming !" % url)
+                time.sleep(2**attempt)
+            except requests.HTTPError as e:
+                raise IOError("Download of '%s' failed - %s" % (url, e))
+            else:
+                break
+        # verification: a corrupted download is discarded altogether
+        def _discard():
+            [os.remove(f) for f in (part, '%s.headers' % part) if osp.exists(f)]
+        nbytes = osp.getsize(part)
+        if counters['total'] is not None and nbytes != counters['total']:
+            _discard()
+            raise IOError("Download of '%s' failed - size %s instead of %s" % (url, nbytes, counters['total']))
+        if checksum is not None:
+            h = hashlib.new(algo.lower())
+            with open(part, 'rb') as f:
+                for block in iter(lambda: f.read(chunksize), b''):
+                    h.update(block)
+            if h.hexdigest().lower() != digest.lower():
+                _discard()
+                raise IOError("Download of '%s' failed - checksum mismatch" % url)
+        if cache is not None:
+            try:
+                with open('%s.headers' % part, 'r') as f:
+                    validators = json.load(f)
+            except:
+                validators = {}
+            dest = cache.put(url, part, meta = validators)
+            _discard()
+            return dest
+        os.replace(part, dest)
+        if osp.exists('%s.headers' % part):
+            os.replace('%s.headers' % part, '%s.headers' % dest)
+        return dest
 
     #/************************************************************************/
     @staticmethod
-    def get_response(url, caching=False, force=True, store=None, expire=0):
+    def get_response(url, caching=False, force=True, store=None, expire=0, timeout=DEF_TIMEOUT):
         if caching is False or store is None:
             try:
-                response = requests.get(url)
+                response = Requests.session().get(url, timeout = timeout)
                 response.raise_for_status()
             except: # (requests.URLRequired,requests.HTTPError,requests.RequestException):
                 raise IOError("Wrong request formulated")
         else:
             try:
-                response, _ = Requests.cache_response(url, force, store, expire)
+                response, _ = Requests.cache_response(url, force, store, expire,
+                                                      timeout = timeout)
                 response.raise_for_status()
             except:     raise IOError("Wrong request formulated")
         try:
@@ -444,6 +1505,10 @@ class Requests(object):
                     stream = 'jsontext' # force
             else:
                 return data
+        elif stream in ('raw', 'bytesio', 'zip') and isinstance(response, CachedResponse):
+            # cached content: the path of the file is passed on, instead of the
+            # content, so that the readers open (and close) it themselves
+            return response.pathname
         elif stream == 'raw':
             try:
                 data = response.raw
@@ -474,7 +1539,7 @@ class Requests(object):
                 except:
                     try:
                          # assert _is_chardet_installed is True
-                        data = json.loads(data.decode(chardet.detect(data)["encoding"]))
+                        data = json.loads(data.decode(File.sniff_encoding(data)))
                     except:     raise IOError("Error JSON-encoding of bytes content")
         return data
 
@@ -484,6 +1549,9 @@ class Requests(object):
         stream = kwargs.pop('stream', None)
         caching = kwargs.pop('caching', False)
         force, store, expire = kwargs.pop('cache_force', True), kwargs.pop('cache_store', None), kwargs.pop('cache_expire', 0)
+        timeout = kwargs.pop('timeout', DEF_TIMEOUT)
+        if kwargs.get('pool') is not None:
+            Requests.session(pool = kwargs.pop('pool'))
         try:
             assert any([urlname.startswith(p) for p in ['http', 'https', 'ftp']]) is True
         except:
@@ -491,7 +1559,7 @@ class Requests(object):
             logging.warning("\n! Protocol not encoded in URL !")
         try:
             response = Requests.get_response(urlname, caching=caching, force=force,
-                                             store=store, expire=expire)
+                                             store=store, expire=expire, timeout=timeout)
         except:     raise IOError("Wrong request for data from URL '%s'" % urlname)
         try:
             data = Requests.read_response(response, stream=stream)
@@ -553,7 +1621,15 @@ class Buffer(object):
         except:     raise TypeError("Wrong type for data source parameter '%s' - must be a string" % src)
         if src is None:
             src, file = file, None
-        if any([src.startswith(p) for p in PROTOCOLS]):
+        download = kwargs.pop('download', False) # not parsed to the readers
+        if any([src.startswith(p) for p in PROTOCOLS]) and download is True:
+            # stream the source straight to disk, and carry on with the local file
+            try:
+                content = Requests.download(src, store = kwargs.get('cache_store'),
+                                            expire = kwargs.get('cache_expire'),
+                                            force = kwargs.get('cache_force'))
+            except:     raise IOError("Wrong download of data source from URL '%s'" % src)
+        elif any([src.startswith(p) for p in PROTOCOLS]):
             try:
                 content = Requests.read_url(src, **kwargs)
             except:     raise IOError("Wrong request for data source from URL '%s'" % src)
@@ -567,12 +1643,13 @@ class Buffer(object):
         # # them into dataframes -
         if kwargs.get('on_disk',False) is True:
             # path = kwargs.pop('store') if 'store' in kwargs else File.default_cache()
-            path = kwargs.pop('store',None) or File.default_cache()
-            kwargs.update({'extract': file, 'path': path})
+            # members are extracted into the cache store
+            store = kwargs.pop('store',None) or kwargs.get('cache_store')
+            kwargs.update({'extract': file, 'store': store})
         else:
             kwargs.update({'open': file}) # when file=None, will read a single file
         if (zipfile.is_zipfile(content) or any([src.endswith(p) for p in COMPRESSIONS])) \
-            and osp.splitext(content)[1] != ".xlsx":
+            and osp.splitext(src)[1] != ".xlsx":
             try:
                 # file = File.unzip(content, namelist=True)
                 results = File.unzip(content, **kwargs)
@@ -624,19 +1701,123 @@ class Frame(object):
                     return df[column].astype(object)
         else:
              # ofmt='%d/%m/%Y', ifmt='%d-%m-%Y %H:%M'
-            if ifmt in (None,'') :
-                kwargs = {'infer_datetime_format': True}
-            else:
-                kwargs = {}
             if ofmt in (None,'') or ofmt == '':
                 return df[column].astype(str)
-            else:
-                try:
-                    ifmt = ifmt or DEF_DATETIMEFMT
-                    f = lambda s: datetime.strptime(s, ifmt, **kwargs).strftime(ofmt)
-                    return df[column].astype(str).apply(f)
-                except:
-                    return df[column].astype(str)
+            elif pd.api.types.is_datetime64_any_dtype(df[column]): # already parsed
+                return df[column].dt.strftime(ofmt)
+            # low-cardinality columns are parsed and formatted once per distinct value
+            codes, uniques = pd.factorize(df[column])
+            lowcard = len(uniques) <= DEF_CARDINALITY * len(codes)
+            values = pd.Series(uniques if lowcard else df[column].to_numpy()).astype(str)
+            if ifmt in (None,''):
+                ifmt = Frame.infer_datetime_format(values) or DEF_DATETIMEFMT
+            dates = pd.to_datetime(values, format = ifmt, errors = 'coerce')
+            res = dates.dt.strftime(ofmt).to_numpy(dtype=object)
+            failed = dates.isna().to_numpy()
+            if lowcard:
+                res, failed = res[codes], failed[codes]
+            res[codes < 0] = np.nan
+            nfailed = int((failed & (codes >= 0)).sum())
+            if nfailed > 0:
+                logging.warning("\n! %s value(s) of column '%s' not parsed with date format '%s' !"
+                                % (nfailed, column, ifmt))
+            res = pd.Series(res, index = df.index, name = column)
+            res.attrs.update({'failed': nfailed})
+            return res
+
+    #/************************************************************************/
+    @staticmethod
+    def compact(df, columns=None, cardinality=DEF_CATEGORIES, strings=True, downcast=True):
+        """Compact the in-memory representation of a dataframe: text columns with
+        few distinct values are stored as categorical, the other text columns as
+        Arrow strings, and numeric columns with the smallest type holding their
+        values.
+
+            >>> dfnew = Frame.compact(df, columns = None, cardinality = DEF_CATEGORIES,
+                                      strings = True, downcast = True)
+
+        Keyword arguments
+        -----------------
+        columns : list
+            columns to compact; default: all columns.
+        cardinality : float
+            maximum ratio of distinct values for a text column to be stored as
+            categorical; set to 0 to store no categorical; default: :data:`DEF_CATEGORIES`\ .
+        strings : bool
+            flag set to store the other text columns as Arrow strings (requires
+            :mod:`pyarrow`); default: `True`.
+        downcast : bool
+            flag set to downcast integers, and floats when no precision is lost;
+            default: `True`.
+
+        Mixed columns (e.g., text and numbers) are left unchanged, so that the
+        values are preserved.
+        """
+        if columns is None:
+            columns = df.columns
+        elif isinstance(columns, string_types):
+            columns = [columns,]
+        try:
+            assert isinstance(cardinality, (int,float)) and 0 <= cardinality <= 1
+        except:     raise TypeError("Wrong format for CARDINALITY ratio - must be a float in [0,1]")
+        if strings is True and _is_pyarrow_installed is True:
+            try:
+                strtype = pd.StringDtype('pyarrow', na_value = np.nan)
+            except TypeError: # older versions of pandas
+                strtype = pd.StringDtype('pyarrow')
+        else:
+            strtype = None
+        res = {}
+        for col in [c for c in columns if c in df.columns]:
+            s = df[col]
+            if pd.api.types.is_object_dtype(s.dtype) or isinstance(s.dtype, pd.StringDtype):
+                if pd.api.types.is_object_dtype(s.dtype)                                    \
+                        and pd.api.types.infer_dtype(s, skipna = True) not in ('string', 'empty'):
+                    continue
+                if s.nunique(dropna = True) <= cardinality * len(s):
+                    res.update({col: s.astype('category')})
+                elif strtype is not None and s.dtype != strtype:
+                    res.update({col: s.astype(strtype)})
+            elif downcast is True and pd.api.types.is_integer_dtype(s.dtype)               \
+                    and not pd.api.types.is_bool_dtype(s.dtype):
+                res.update({col: pd.to_numeric(s, downcast = 'integer')})
+            elif downcast is True and pd.api.types.is_float_dtype(s.dtype)                 \
+                    and s.dtype.itemsize > 4:
+                f = s.astype('float32')
+                if ((f.astype(s.dtype) == s) | s.isna()).all(): # no precision lost
+                    res.update({col: f})
+        if res == {}:
+            return df
+        df = df.copy(deep = False)
+        for col, s in res.items():
+            df[col] = s
+        return df
+
+    #/************************************************************************/
+    @staticmethod
+    def infer_datetime_format(values, sample=DEF_DATESAMPLE):
+        """Infer the format of the dates represented in a series of strings from
+        a sample of its distinct values.
+
+            >>> fmt = Frame.infer_datetime_format(values, sample = DEF_DATESAMPLE)
+
+        Returns
+        -------
+        fmt : str
+            the format matched by most of the sampled values, with days first in
+            case of ambiguity, or `None` when no format is found.
+        """
+        if guess_datetime_format is None:
+            return None
+        values = pd.Series(values).dropna().astype(str).unique()[:sample]
+        fmts = {}
+        for v in values:
+            try:
+                fmt = guess_datetime_format(v, dayfirst = True)
+            except:     continue
+            if fmt is not None:
+                fmts.update({fmt: fmts.get(fmt, 0) + 1})
+        return max(fmts, key = fmts.get) if fmts != {} else None
 
     #/************************************************************************/
     @staticmethod
@@ -657,15 +1838,18 @@ class Frame(object):
 
     #/************************************************************************/
     @staticmethod
-    def to_geojson(df, columns=None, latlon=None):
-        """GEOJSON output formatting.
+    def _geo_columns(df, columns=None, latlon=None):
+        """Retrieve the columns used as properties and as geographical coordinates
+        of the features.
+
+            >>> columns, lat, lon = Frame._geo_columns(df, columns = None, latlon = None)
         """
         try:
             assert columns is None or isinstance(columns, string_types)     \
                 or (isinstance(columns, Sequence) and all([isinstance(c,string_types) for c in columns]))
         except:     raise TypeError("Wrong format for input COLUMNS")
         if isinstance(columns, string_types):
-            columns == [columns,]
+            columns = [columns,]
         if columns in (None,[]):
             columns = df.columns
         try:
@@ -680,7 +1864,7 @@ class Frame(object):
                     assert 'latitude' in df.columns and 'longitude' in df.columns
                 except:     raise IOError("No LATLON columns parsed as latitude/longitude coordinates")
                 else:
-                    lat, lon = 'latitude', 'latitude'
+                    lat, lon = 'latitude', 'longitude'
             else:
                 lat, lon = 'lat', 'lon'
         elif isinstance(latlon,string_types):
@@ -693,31 +1877,247 @@ class Frame(object):
                 lat, lon = latlon
                 assert lat in df.columns and lon in df.columns
             except:     raise IOError("LATLON columns '%s' not found in the input dataset" % list(latlon))
-        columns = list(set(columns)
-                       .intersection(set(df.columns))
-                       .difference(set([lat,lon]))
-                       )
-        # df.reindex(columns = columns) # not necessary
-        if _is_geojson_installed is True:
-            features = df.apply(
-                    lambda row: Feature(geometry=Point((float(row[lon]), float(row[lat])))),
-                    axis=1).tolist()
-            properties = df[columns].to_dict('records') # columns used as properties
-            # properties = df.drop([lat, lon], axis=1).to_dict('records')
-            geom = FeatureCollection(features=features, properties=properties)
+        columns = [col for col in dict.fromkeys(columns)
+                   if col in df.columns and col not in (lat, lon)]
+        return columns, lat, lon
+
+    #/************************************************************************/
+    @staticmethod
+    def _geo_coords(df, lat, lon):
+        """Retrieve the geographical coordinates of the features as float arrays.
+        """
+        if lat == lon: # both coordinates stored in a single column
+            latlon = df[lat].astype(str).str.split(pat = r'\s+', n = 1, expand = True)
+            y, x = latlon[0], latlon[1] if latlon.shape[1] > 1 else np.nan
+        else:
+            y, x = df[lat], df[lon]
+        return pd.to_numeric(pd.Series(y), errors = 'coerce').to_numpy(dtype=float), \
+            pd.to_numeric(pd.Series(x), errors = 'coerce').to_numpy(dtype=float)
+
+    #/************************************************************************/
+    @staticmethod
+    def to_geojson(df, columns=None, latlon=None):
+        """GEOJSON output formatting: the whole feature collection is built in
+        memory (see :meth:`write_geojson` to write it to a file).
+
+            >>> geom = Frame.to_geojson(df, columns = None, latlon = None)
+        """
+        columns, lat, lon = Frame._geo_columns(df, columns = columns, latlon = latlon)
+        y, x = Frame._geo_coords(df, lat, lon)
+        # columns used as properties
+        properties = df[columns].to_dict('records') if columns != [] else [{}] * len(df)
+        features = [{'type': 'Feature',
+                     'geometry': None if np.isnan(l) or np.isnan(L) else {'type': 'Point', 'coordinates': [L, l]},
+                     'properties': p}
+                    for (l, L, p) in zip(y.tolist(), x.tolist(), properties)]
+        return {'type': 'FeatureCollection', 'features': features}
+
+    #/************************************************************************/
+    @staticmethod
+    def write_geojson(df, dest, columns=None, latlon=None, **kwargs):
+        """Write a dataframe as GeoJSON point features, encoded batch by batch from
+        the columns of the dataframe and streamed to the output file, so that the
+        memory used does not depend on the number of features.
+
+            >>> Frame.write_geojson(df, dest, columns = None, latlon = None,
+                                    seq = False, precision = DEF_PRECISION,
+                                    batchsize = DEF_BATCHSIZE, mode = 'w')
+
+        Keyword arguments
+        -----------------
+        seq : bool
+            flag set to write newline-delimited GeoJSON (GeoJSONSeq), one feature
+            per line, instead of a feature collection; default: `False`.
+        precision : int
+            number of decimals of the coordinates; default: :data:`DEF_PRECISION`\ .
+        batchsize : int
+            number of features encoded at once; default: :data:`DEF_BATCHSIZE`\ .
+        mode : str
+            'w' to (over)write the file, 'a' to append features to it (GeoJSONSeq
+            only).
+        encoding, ensure_ascii :
+            encoding of the output file, and flag set to escape non-ASCII characters.
+        """
+        seq = kwargs.pop('seq', False)
+        precision = kwargs.pop('precision', None)
+        precision = DEF_PRECISION if precision is None else int(precision)
+        batchsize = kwargs.pop('batchsize', None) or DEF_BATCHSIZE
+        mode = kwargs.pop('mode', 'w')
+        try:
+            assert mode == 'w' or (mode == 'a' and seq is True)
+        except:     raise IOError("Append mode only supported for GeoJSONSeq output")
+        enc = kwargs.pop('encoding', None) or kwargs.pop('enc', None) or DEF_ENCODING
+        asc = kwargs.pop('ensure_ascii', False)
+        columns, lat, lon = Frame._geo_columns(df, columns = columns, latlon = latlon)
+        point = '{"type":"Feature","geometry":{"type":"Point","coordinates":['
+        with open(dest, mode, encoding = enc) as f:
+            if seq is False:
+                f.write('{"type":"FeatureCollection","features":[\n')
+            for i in range(0, len(df), batchsize):
+                batch = df.iloc[i:i+batchsize]
+                y, x = Frame._geo_coords(batch, lat, lon)
+                if columns != []:
+                    props = batch[columns].to_json(orient = 'records', lines = True,
+                                                   date_format = 'iso', force_ascii = asc)
+                    props = np.array(props.rstrip('\n').split('\n'))
+                else:
+                    props = np.full(len(batch), '{}')
+                nan = np.isnan(x) | np.isnan(y)
+                # coordinates pairs encoded at once, e.g. '[[x1,y1],[x2,y2]]'
+                coords = pd.DataFrame({'x': x, 'y': y}).to_json(orient = 'values',
+                                                                double_precision = precision)
+                coords = np.array(coords[2:-2].split('],[')) if len(batch) > 0 else np.array([], dtype=str)
+                geoms = np.char.add(np.char.add(point, coords), ']}')
+                geoms[nan] = '{"type":"Feature","geometry":null'
+                features = np.char.add(np.char.add(np.char.add(geoms, ',"properties":'), props), '}')
+                if seq is True:
+                    f.write('\n'.join(features.tolist()) + '\n')
+                else:
+                    f.write((',\n' if i > 0 else '') + ',\n'.join(features.tolist()))
+            if seq is False:
+                f.write('\n]}\n')
+
+    #/************************************************************************/
+    @staticmethod
+    def to_arrow(df, columns=None, dtypes=None):
+        """Convert a dataframe into an Arrow table, with columns typed after the
+        types of the template index.
+
+            >>> table = Frame.to_arrow(df, columns = None, dtypes = None)
+
+        Keyword arguments
+        -----------------
+        dtypes : dict
+            types of the columns, as names of Python types (e.g., 'str', 'int'),
+            see :data:`ARROW_TYPES`; columns that cannot be cast keep their type.
+        """
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise IOError("Package pyarrow not installed - Arrow formats not available")
+        if columns not in (None,[]):
+            df = df[[col for col in columns if col in df.columns]]
+        table = pa.Table.from_pandas(df, preserve_index = False)
+        for col, typ in (dtypes or {}).items():
+            try:
+                i = table.schema.get_field_index(col)
+                assert i >= 0 and typ in ARROW_TYPES
+                otype = pa.type_for_alias(ARROW_TYPES[typ])
+                if table.schema.field(i).type != otype:
+                    table = table.set_column(i, col, table.column(i).cast(otype))
+            except:
+                continue
+        return table
+
+    #/************************************************************************/
+    @staticmethod
+    def write_arrow(df, dest, fmt='parquet', columns=None, dtypes=None, **kwargs):
+        """Write a dataframe into a columnar file: Parquet, GeoParquet (Parquet with
+        a WKB point geometry built from the geographical coordinates) or Feather
+        (Arrow IPC).
+
+            >>> Frame.write_arrow(df, dest, fmt = 'parquet', columns = None, dtypes = None,
+                                  latlon = None, crs = None, compression = None)
+
+        Keyword arguments
+        -----------------
+        dtypes : dict
+            see :meth:`to_arrow`.
+        latlon :
+            geographical coordinates of the GeoParquet geometry, see :meth:`to_geojson`.
+        crs : str, dict
+            coordinate reference system of the GeoParquet geometry; default:
+            longitude/latitude (OGC:CRS84).
+        compression : str
+            compression codec, e.g. 'snappy', 'zstd', 'gzip', 'lz4' or 'none';
+            default: :data:`DEF_COMPRESSION`\ .
+        """
+        try:
+            assert fmt in ARROW_FORMATS
+        except:     raise IOError("Wrong columnar format '%s' - must be any among '%s'" % (fmt, ARROW_FORMATS))
+        table = Frame.to_arrow(df, columns = columns, dtypes = dtypes)
+        if fmt == 'geoparquet':
+            _, lat, lon = Frame._geo_columns(df, latlon = kwargs.pop('latlon', None))
+            y, x = Frame._geo_coords(df, lat, lon)
+            nan = np.isnan(x) | np.isnan(y)
+            # WKB points: byte order, geometry type, and both coordinates
+            wkb = np.zeros(len(df), dtype = [('order','u1'), ('type','<u4'), ('x','<f8'), ('y','<f8')])
+            wkb['order'], wkb['type'], wkb['x'], wkb['y'] = 1, 1, x, y
+            geom = pa.FixedSizeBinaryArray.from_buffers(pa.binary(wkb.itemsize), len(df),
+                                                         [None, pa.py_buffer(wkb.tobytes())])
+            geom = pc.if_else(pa.array(nan), pa.scalar(None, pa.binary()),
+                                      geom.cast(pa.binary()))
+            meta = {'encoding': 'WKB', 'geometry_types': ['Point']}
+            if not nan.all():
+                meta.update({'bbox': [float(np.nanmin(x[~nan])), float(np.nanmin(y[~nan])),
+                                      float(np.nanmax(x[~nan])), float(np.nanmax(y[~nan]))]})
+            crs = kwargs.pop('crs', None)
+            if crs not in (None,'') and not isinstance(crs, Mapping): # PROJJSON otherwise
+                try:
+                    assert _is_pyproj_installed is True
+                    crs = pyproj.CRS.from_user_input(crs).to_json_dict()
+                except:
+                    # GeoParquet only supports PROJJSON: the CRS is declared unknown
+                    logging.warning("\n! CRS '%s' not converted to PROJJSON - written as unknown !" % crs)
+                    crs = None
+                meta.update({'crs': crs})
+            elif isinstance(crs, Mapping):
+                meta.update({'crs': crs})
+            geo = {'version': '1.0.0', 'primary_column': 'geometry', 'columns': {'geometry': meta}}
+            table = table.append_column('geometry', geom)
+            table = table.replace_schema_metadata(dict(table.schema.metadata or {},
+                                                       geo = json.dumps(geo)))
+        compression = kwargs.pop('compression', None)                       \
+            or DEF_COMPRESSION['parquet' if fmt.endswith('parquet') else 'feather']
+        if fmt.endswith('parquet'):
+            nkw = Object.inspect_kwargs(kwargs, pq.write_table)
+            pq.write_table(table, dest, compression = compression, **nkw)
         else:
-            # see https://geoffboeing.com/2015/10/exporting-python-data-geojson/
-            geom = {'type':'FeatureCollection', 'features':[]}
-            for _, row in df.iterrows():
-                feature = {'type':'Feature',
-                           'properties':{},
-                           'geometry':{'type':'Point',
-                                       'coordinates':[]}}
-                feature['geometry']['coordinates'] = [float(row[lon]), float(row[lat])]
-                for col in columns:
-                    feature['properties'][col] = row[col]
-                geom['features'].append(feature)
-        return geom
+            nkw = Object.inspect_kwargs(kwargs, pf.write_feather)
+            pf.write_feather(table, dest, compression = 'uncompressed' if compression == 'none' else compression,
+                             **nkw)
+
+    #/************************************************************************/
+    @staticmethod
+    def write_arrow_csv(df, dest, sep=',', header=True, index=True, columns=None, mode='w',
+                        encoding=None, na_rep='', batchsize=None):
+        """Write a dataframe into a CSV file with the (multithreaded) Arrow writer.
+
+            >>> Frame.write_arrow_csv(df, dest, sep = ',', header = True, index = True,
+                                      columns = None, mode = 'w', batchsize = None)
+
+        Keyword arguments
+        -----------------
+        sep, header, index, columns, mode :
+            see :meth:`pandas.DataFrame.to_csv`; :data:`header` may also be the list
+            of aliases of the columns.
+        batchsize : int
+            number of rows encoded at once; default: the Arrow default.
+
+        Only the UTF-8 encoding and empty missing values are supported; otherwise,
+        or when :mod:`pyarrow` is not installed, an error is raised.
+        """
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise IOError("Package pyarrow not installed - Arrow CSV engine not available")
+        try:
+            assert encoding in (None, '') or encoding.lower().replace('_','-') in ('utf-8', 'utf8')
+            assert na_rep in (None, '')
+        except:     raise IOError("Encoding or missing values representation not supported by Arrow CSV engine")
+        if columns is not None:
+            df = df[[columns,] if isinstance(columns, string_types) else list(columns)]
+        if isinstance(header, Sequence) and not isinstance(header, string_types):
+            df = df.set_axis(list(header), axis = 1)
+        if index is True:
+            df = df.reset_index()
+        table = pa.Table.from_pandas(df, preserve_index = False)
+        opts = {'include_header': header is not False, 'delimiter': sep or ','}
+        if batchsize is not None:
+            opts.update({'batch_size': batchsize})
+        if mode == 'a':
+            with open(dest, 'ab') as f:
+                pcsv.write_csv(table, f, write_options = pcsv.WriteOptions(**opts))
+        else:
+            pcsv.write_csv(table, dest, write_options = pcsv.WriteOptions(**opts))
 
     #/************************************************************************/
     @staticmethod
@@ -776,9 +2176,32 @@ class Frame(object):
         logging.warning("\n! Method 'to_xml' for xml data writing not implemented !")
         pass
 
+    #/************************************************************************/
+    @staticmethod
+    def iter_chunks(df, chunksize=DEF_CHUNKSIZE):
+        """Iterate over consecutive chunks of rows of a dataframe.
+
+            >>> for chunk in Frame.iter_chunks(df, chunksize = DEF_CHUNKSIZE): ...
+        """
+        for i in range(0, max(len(df),1), chunksize):
+            yield df.iloc[i:i+chunksize]
+
     #/************************************************************************/
     @staticmethod
     def to_file(df, dest, **kwargs):
+        """Write a dataframe to file(s).
+
+            >>> Frame.to_file(df, dest, fmt = None, mode = 'w', **kwargs)
+
+        Keyword arguments
+        -----------------
+        mode : str
+            'w' to (over)write the file, 'a' to append to it; appending is only
+            supported by the formats in :data:`APPEND_FORMATS`\ .
+        engine : str
+            engine used to write CSV data, any of :data:`CSV_ENGINES`; 'pyarrow'
+            uses :meth:`write_arrow_csv`; default: :data:`DEF_CSV_ENGINE`\ .
+        """
         ofmt = kwargs.pop('fmt', None)
         infer_fmt = kwargs.pop('infer_fmt', DEF_INFER_FORMAT)
         if infer_fmt is True:
@@ -788,6 +2211,15 @@ class Frame(object):
         except:     raise IOError("Data format FMT not recognised: '%s'" % ofmt)
         def _to_csv(df, d, **kw):
             nkw = Object.inspect_kwargs(kw, pd.DataFrame.to_csv)
+            if kw.get('engine', DEF_CSV_ENGINE) == 'pyarrow' and _is_pyarrow_installed is True:
+                akw = Object.inspect_kwargs(kw, Frame.write_arrow_csv)
+                try: # options only supported by pandas are honoured
+                    assert all([nkw[k] is None for k in nkw if k not in akw])
+                    Frame.write_arrow_csv(df, d, **akw)
+                except:
+                    logging.warning("\n! Arrow CSV engine not available for writing - pandas used instead !")
+                else:
+                    return
             df.to_csv(d, **nkw)
         def _to_excel(df, d, **kw):
             nkw = Object.inspect_kwargs(kw, pd.DataFrame.to_excel)
@@ -800,20 +2232,21 @@ class Frame(object):
             with open(d, 'w', encoding = enc) as f:
                 Json.dump(res, f) #ensure_ascii=False)
         def _to_geojson(df, d, **kw):
-            if _is_geopandas_installed is True:
-                if isinstance(df, gpd.GeoSeries):
-                    nkw = Object.inspect_kwargs(kw, gpd.GeoSeries.to_file)
-                    df.to_file(d, driver='GeoJSON', **nkw)
-                elif isinstance(df, gpd.GeoDataFrame):
-                    nkw = Object.inspect_kwargs(kw, gpd.GeoDataFrame.to_file)
+            if _is_geopandas_installed is True and isinstance(df, (gpd.GeoSeries, gpd.GeoDataFrame)):
+                nkw = Object.inspect_kwargs(kw, df.to_file)
                 df.to_file(d, driver='GeoJSON', **nkw)
             else:
-                nkw = Object.inspect_kwargs(kw, Frame.to_geojson)
-                res = Frame.to_geojson(df, **nkw)
-                enc = kw.pop('encoding', None) or kw.pop('enc', None) or DEF_ENCODING
-                asc = kw.pop('ensure_ascii', False)
-                with open(d, 'w', encoding = enc) as f:
-                    Json.dump(res, f, ensure_ascii = asc)
+                kw.update({'seq': False})
+                Frame.write_geojson(df, d, **{k: kw[k] for k in GEOJSON_KWARGS if k in kw})
+        def _to_geojsonseq(df, d, **kw):
+            kw.update({'seq': True})
+            Frame.write_geojson(df, d, **{k: kw[k] for k in GEOJSON_KWARGS if k in kw})
+        def _to_parquet(df, d, **kw):
+            Frame.write_arrow(df, d, fmt = 'parquet', **kw)
+        def _to_geoparquet(df, d, **kw):
+            Frame.write_arrow(df, d, fmt = 'geoparquet', **kw)
+        def _to_feather(df, d, **kw):
+            Frame.write_arrow(df, d, fmt = 'feather', **kw)
         def _to_geopackage(df, d, **kw):
             nkw = Object.inspect_kwargs(kwargs, gpd.to_file)
             df.to_file(d, driver='GPKG', **nkw)
@@ -821,14 +2254,25 @@ class Frame(object):
                     'xls':      _to_excel,
                     'json':     _to_json,
                     'geojson':  _to_geojson,
+                    'geojsonl': _to_geojsonseq,
+                    'parquet':  _to_parquet,
+                    'geoparquet': _to_geoparquet,
+                    'feather':  _to_feather,
+                    'arrow':    _to_feather,
                     'gpkg':     _to_geopackage
                     }
+        mode = kwargs.get('mode', 'w')
         for f in ofmt:
-            try:
-                assert not FileSys.file_exists(dest)
-            except:
-                logging.warning("\n! Output file '%s.%s' already exist - will be overwritten" %
-                              (FileSys.basename(dest),f))
+            if mode == 'a':
+                if not f in APPEND_FORMATS:
+                    logging.warning("\n! Append mode not supported for %s !" % f.upper())
+                    continue
+            else:
+                try:
+                    assert not FileSys.file_exists(dest)
+                except:
+                    logging.warning("\n! Output file '%s.%s' already exist - will be overwritten" %
+                                  (FileSys.basename(dest),f))
             try:
                 fundumps[f](df, dest, **kwargs)
             except:
@@ -897,12 +2341,39 @@ class Frame(object):
     #/************************************************************************/
     @staticmethod
     def from_data(data, src=None, **kwargs):
-        """
+        """Load data into a dataframe, or into an iterator of dataframes when
+        a chunk size is parsed.
+
+            >>> df = Frame.from_data(data, src = None, fmt = None, chunksize = None, **kwargs)
+
+        Keyword arguments
+        -----------------
+        chunksize : int
+            number of rows per chunk; the formats in :data:`CHUNK_FORMATS` are read
+            lazily, the others are loaded first and then split.
+        content_type : str
+            content-type of the data, used together with its head to detect the
+            format when several are possible (see :meth:`File.sniff_format`).
+        sniff : bool
+            flag set to infer the encoding and the dialect of CSV data from the head
+            of the data (see :meth:`File.sniff_dialect`); default: `True`.
+        infer_header : bool
+            flag set to also infer the header row of CSV data when sniffing it;
+            otherwise, pandas' default inference is used; default: `False`.
+        engine : str
+            engine used to read CSV data, any of :data:`CSV_ENGINES` or of the engines
+            of :meth:`pandas.read_csv`; 'pyarrow' uses :meth:`from_arrow_csv`, and
+            falls back to pandas for the options it does not support; default:
+            :data:`DEF_CSV_ENGINE`\ .
         """
         ifmt = kwargs.pop('fmt', None)
+        chunksize = kwargs.pop('chunksize', None)
+        ctype = kwargs.pop('content_type', None)
+        sniff = kwargs.pop('sniff', True)
+        infer_header = kwargs.pop('infer_header', False)
         try:
             assert (ifmt is None and src is not None)
-            ifmt = osp.splitext(src)[-1].replace('.','').lower()
+            ifmt = osp.splitext(src)[-1].replace('.','').lower() or None
         except:
             pass
         infer_fmt= kwargs.pop('infer_fmt', DEF_INFER_FORMAT)
@@ -912,13 +2383,54 @@ class Frame(object):
             infer_fmt = DEF_FORMATS # = list(FORMATS.values())
         except:
             pass
+        explicit = ifmt is not None # otherwise, the default formats are candidates
         try:
             ifmt = File.check_format(ifmt, infer_fmt = infer_fmt)
         except:     raise IOError("Data format FMT not recognised: '%s'" % ifmt)
+        if len(ifmt) > 1:
+            # detect the format instead of trying every reader in turn
+            try:
+                fmt, confidence = File.sniff_format(data, src = src if isinstance(src, string_types) else None,
+                                                    ctype = ctype)
+                assert fmt in ifmt or (explicit is False and fmt is not None)
+            except:
+                pass
+            else:
+                if confidence >= DEF_CONFIDENCE or fmt in ifmt:
+                    # read the detected format first, the other readers remain fallbacks
+                    ifmt = [fmt,] + [f for f in ifmt if f != fmt]
+        if sniff is True and ifmt[0] in ('csv', 'table'):
+            # infer the dialect from the head of the data: explicit options prevail
+            try:
+                opts = File.sniff_dialect(data, encoding = kwargs.get('encoding'),
+                                          header = infer_header)
+            except:
+                opts = {}
+            if 'delimiter' in kwargs or ifmt[0] == 'table':
+                opts.pop('sep', None)
+            kwargs.update({k: v for (k, v) in opts.items() if k not in kwargs})
         #kwargs.update({'dtype': kwargs.pop('dtype', object),
         #               'compression': kwargs.pop('compression','infer')})
         def _read_csv(s, **kw):
+            engine = kw.pop('engine', DEF_CSV_ENGINE)
+            if engine not in CSV_ENGINES: # any other pandas engine
+                kw.update({'engine': engine})
+            if 'delimiter' in kw:
+                kw.update({'sep': kw.pop('delimiter')})
             nkw = Object.inspect_kwargs(kw, pd.read_csv)
+            if engine == 'pyarrow' and _is_pyarrow_installed is True:
+                akw = Object.inspect_kwargs(kw, Frame.from_arrow_csv)
+                try:
+                    pos = s.tell() if s.seekable() else None
+                except:
+                    pos = None
+                try: # options only supported by pandas are honoured
+                    assert all([nkw[k] is None for k in nkw if k not in akw])
+                    return Frame.from_arrow_csv(s, **akw)
+                except:
+                    logging.warning("\n! Arrow CSV engine not available for reading - pandas used instead !")
+                    if pos is not None:
+                        s.seek(pos)
             return pd.read_csv(s, **nkw)
         def _read_excel(s, **kw):
             nkw = Object.inspect_kwargs(kw, pd.read_excel)
@@ -983,6 +2495,12 @@ class Frame(object):
         def _read_table(s, **kw):
             nkw = Object.inspect_kwargs(kw, pd.read_table)
             return pd.read_table(s, **nkw)
+        def _read_parquet(s, **kw):
+            nkw = Object.inspect_kwargs(kw, Frame.from_arrow)
+            return Frame.from_arrow(s, fmt = 'parquet', **nkw)
+        def _read_feather(s, **kw):
+            nkw = Object.inspect_kwargs(kw, Frame.from_arrow)
+            return Frame.from_arrow(s, fmt = 'feather', **nkw)
         funloads = {'csv':      _read_csv,
                     'xls':      _read_excel,
                     'json':     _read_json,
@@ -996,34 +2514,238 @@ class Frame(object):
                     'htmltab':  _read_htmltab,
                     'xml':      _read_xml,
                     'table':    _read_table,
+                    'parquet':  _read_parquet,
+                    'geoparquet': _read_parquet,
+                    'feather':  _read_feather,
+                    'arrow':    _read_feather,
                     }
+        try: # streams are parsed in place: rewind them between attempts
+            pos = data.tell() if data.seekable() else None
+        except:
+            pos = None
         for f in ifmt:
             try:
-                df = funloads[f](data, **kwargs)
+                if pos is not None:
+                    data.seek(pos)
+                if chunksize is not None and f in CHUNK_FORMATS:
+                    df = funloads[f](data, chunksize = chunksize, **kwargs)
+                else:
+                    df = funloads[f](data, **kwargs)
             except FileNotFoundError:
                 raise IOError("Impossible to load source data - file '%s' not found" % src)
             except:     pass
             else:
                 # logging.warning("\n! '%s' data loaded in dataframe !" % f.upper())
+                if chunksize is not None and f not in CHUNK_FORMATS:
+                    df = Frame.iter_chunks(df, chunksize)
                 return df
         raise IOError("Impossible to load source data - format not recognised")
 
+    #/************************************************************************/
+    @staticmethod
+    def from_arrow(data, fmt='parquet', columns=None, usecols=None, filters=None, chunksize=None,
+                   dtype_backend=None):
+        """Load columnar data (Parquet or Feather/Arrow IPC) into a dataframe. Files
+        on disk are memory-mapped, only the projected columns are read, and the row
+        groups are filtered using their statistics.
+
+            >>> df = Frame.from_arrow(data, fmt = 'parquet', columns = None, usecols = None,
+                                      filters = None, chunksize = None, dtype_backend = None)
+
+        Keyword arguments
+        -----------------
+        columns, usecols : list, callable
+            columns to load, as a list of names or a predicate on the names; names
+            missing from the data are ignored.
+        filters : list, pyarrow.compute.Expression
+            predicates on the rows, e.g. :literal:`[('cc', '=', 'FR')]`\ .
+        chunksize : int
+            maximum number of rows per chunk (chunks do not span row groups); an
+            iterator of dataframes is then returned.
+        dtype_backend : str
+            set to 'pyarrow' to keep the Arrow buffers in the dataframe, with no copy
+            at all; otherwise, numeric columns with no missing values are converted
+            with no copy.
+        """
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise IOError("Package pyarrow not installed - Arrow formats not available")
+        columns = columns if columns is not None else usecols
+        if filters is not None and not isinstance(filters, pc.Expression):
+            filters = pq.filters_to_expression(filters)
+        fmt = 'parquet' if fmt.endswith('parquet') else 'ipc'
+        if isinstance(data, string_types) and osp.isfile(data) and fmt == 'ipc':
+            with open(data, 'rb') as f:
+                if f.read(4) == b'FEA1': # Feather V1: not an IPC file, see SIGNATURES
+                    fmt = 'feather'
+        if isinstance(data, string_types) and osp.isfile(data) and fmt == 'feather':
+            dataset = pds.dataset(pf.read_table(data, memory_map = True))
+        elif isinstance(data, string_types) and osp.isfile(data): # memory-mapped
+            dataset = pds.dataset(data, format = fmt,
+                                  filesystem = pa.fs.LocalFileSystem(use_mmap = True))
+        else:
+            if isinstance(data, bytes):
+                data = pa.BufferReader(data)
+            table = pq.read_table(data) if fmt == 'parquet' else pf.read_table(data)
+            dataset = pds.dataset(table)
+        names = dataset.schema.names
+        if callable(columns):
+            columns = [n for n in names if columns(n)]
+        elif isinstance(columns, string_types):
+            columns = [columns,]
+        if columns is not None:
+            columns = [n for n in columns if n in names]
+        def _to_pandas(t):
+            if dtype_backend == 'pyarrow':
+                return t.to_pandas(types_mapper = pd.ArrowDtype)
+            return t.to_pandas(split_blocks = True, self_destruct = True)
+        if chunksize is not None:
+            batches = dataset.to_batches(columns = columns, filter = filters,
+                                         batch_size = chunksize)
+            return (_to_pandas(pa.Table.from_batches([b])) for b in batches)
+        return _to_pandas(dataset.to_table(columns = columns, filter = filters))
+
+    #/************************************************************************/
+    @staticmethod
+    def from_arrow_csv(data, sep=',', encoding=None, header='infer', names=None, usecols=None,
+                       dtype=None, quotechar='"', decimal='.', skiprows=None, chunksize=None,
+                       blocksize=None, use_threads=True):
+        """Load CSV data into a dataframe with the Arrow reader: blocks of the data
+        are parsed in parallel, and the data can be streamed batch by batch.
+
+            >>> df = Frame.from_arrow_csv(data, sep = ',', encoding = None, header = 'infer',
+                                          usecols = None, dtype = None, chunksize = None,
+                                          blocksize = None, use_threads = True)
+
+        Keyword arguments
+        -----------------
+        sep, encoding, header, names, usecols, dtype, quotechar, skiprows :
+            see :meth:`pandas.read_csv`; :data:`header` and :data:`skiprows` shall be
+            integers (or `None`), and :data:`dtype` types supported by Arrow.
+        chunksize : int
+            number of rows per chunk; an iterator of dataframes is then returned, and
+            the data are read as the iterator is consumed.
+        blocksize : int
+            size (in bytes) of the blocks parsed at once; default: :data:`DEF_BLOCKSIZE`\ .
+        use_threads : bool
+            flag set to parse the blocks in parallel; default: `True`.
+
+        Options not supported by the Arrow reader (e.g., a decimal separator other
+        than '.') raise an error before any data is read.
+        """
+        try:
+            assert _is_pyarrow_installed is True
+        except:     raise IOError("Package pyarrow not installed - Arrow CSV engine not available")
+        try:
+            assert decimal in (None, '.')
+            assert header in ('infer', None) or isinstance(header, int)
+            assert skiprows is None or isinstance(skiprows, int)
+        except:     raise IOError("Options not supported by Arrow CSV engine")
+        if header == 'infer':
+            header = 0 if names is None else None
+        skip = (skiprows or 0) + (header or 0)
+        ropts = {'encoding': ENCODINGS.get(encoding, encoding) or DEF_ENCODING,
+                 'block_size': blocksize or DEF_BLOCKSIZE, 'use_threads': use_threads}
+        if names is not None:
+            ropts.update({'column_names': list(names)})
+            skip += 0 if header is None else 1
+        elif header is None:
+            ropts.update({'autogenerate_column_names': True})
+        ropts.update({'skip_rows': skip})
+        popts = pcsv.ParseOptions(delimiter = sep or ',', quote_char = quotechar or False)
+        if isinstance(data, bytes):
+            data = pa.BufferReader(data)
+        if isinstance(usecols, string_types):
+            usecols = [usecols,]
+        if callable(usecols) or not (dtype is None or isinstance(dtype, Mapping)):
+            # the names of the columns are needed: read them in the first block only
+            try:
+                pos = data.tell() if data.seekable() else None
+                assert pos is not None
+            except AttributeError:
+                pos = None
+            except:     raise IOError("Column names not available in stream")
+            schema = pcsv.open_csv(data, read_options = pcsv.ReadOptions(**ropts),
+                                   parse_options = popts).schema
+            if pos is not None:
+                data.seek(pos)
+            if callable(usecols):
+                usecols = [n for n in schema.names if usecols(n)]
+            if not (dtype is None or isinstance(dtype, Mapping)):
+                dtype = {n: dtype for n in schema.names}
+        def _arrow_type(t):
+            t = pd.api.types.pandas_dtype(t)
+            if t == object or isinstance(t, pd.StringDtype):
+                return pa.string()
+            return pa.from_numpy_dtype(getattr(t, 'numpy_dtype', t))
+        types = {}
+        for (c, t) in (dtype or {}).items():
+            try:
+                types.update({c: _arrow_type(t)})
+            except:     pass # type set once loaded
+        copts = pcsv.ConvertOptions(include_columns = usecols, column_types = types,
+                                    strings_can_be_null = True, quoted_strings_can_be_null = True)
+        def _to_pandas(t):
+            df = t.to_pandas(split_blocks = True, self_destruct = True)
+            if header is None and names is None: # pandas positional names
+                df.columns = range(len(df.columns))
+            try:
+                df = df.astype({c: t for (c, t) in (dtype or {}).items() if c in df.columns})
+            except:     pass
+            return df
+        if chunksize is None:
+            table = pcsv.read_csv(data, read_options = pcsv.ReadOptions(**ropts),
+                                  parse_options = popts, convert_options = copts)
+            return _to_pandas(table)
+        reader = pcsv.open_csv(data, read_options = pcsv.ReadOptions(**ropts),
+                               parse_options = popts, convert_options = copts)
+        def _iter(): # batches follow the blocks: gather them into chunks of rows
+            batches, n = [], 0
+            for batch in reader:
+                batches.append(batch)
+                n += batch.num_rows
+                while n >= chunksize:
+                    table = pa.Table.from_batches(batches, schema = reader.schema)
+                    yield _to_pandas(table.slice(0, chunksize))
+                    table = table.slice(chunksize)
+                    batches, n = table.to_batches(), table.num_rows
+            if n > 0:
+                yield _to_pandas(pa.Table.from_batches(batches, schema = reader.schema))
+        return _iter()
+
     #/************************************************************************/
     @staticmethod
     def from_url(urlname, **kwargs):
         """
         """
+        kwargs.update({'stream': 'response'})
         try:
-            data = Requests.read_url(urlname, **kwargs)
+            response = Requests.read_url(urlname, **kwargs)
         except:     raise IOError("Wrong request for data from URL '%s'" % urlname)
+        kwargs.pop('stream')
+        if kwargs.get('content_type') is None:
+            kwargs.update({'content_type': response.headers.get('Content-Type')})
         try:
-            return Frame.from_data(data **kwargs)
+            return Frame.from_data(io.BytesIO(response.content), src = urlname, **kwargs)
         except:     raise IOError("Wrong formatting of online data into dataframe")
 
     #/************************************************************************/
     @staticmethod
     def from_zip(file, members, **kwargs):
-        """
+        """Load member(s) of a zip archive into dataframe(s): members are opened
+        as streams and parsed incrementally, neither extracted on disk nor copied
+        in memory.
+
+            >>> df = Frame.from_zip(file, members, chunksize = None, workers = 1, **kwargs)
+
+        Keyword arguments
+        -----------------
+        chunksize : int
+            see :meth:`from_data`; an iterator of dataframes is then returned for
+            every member, and the member is read as the iterator is consumed.
+        workers : int
+            number of members read in parallel when no :data:`chunksize` is set;
+            default: 1; archives that are not on disk are always read sequentially.
         """
         try:
             assert zipfile.is_zipfile(file)
@@ -1066,13 +2788,28 @@ class Frame(object):
                         pass # continue
             if members in ([],None):
                 raise IOError("Impossible to retrieve member file(s) from zipped data")
+        workers = kwargs.pop('workers', None) or 1
+        kwargs.pop('src', None)
+        def _read(m): # every reader opens its own handle on the archive
+            with zipfile.ZipFile(file) as zf, zf.open(m) as zm:
+                return Frame.from_data(zm, src = m, **kwargs)
+        def _iter(m): # the member remains open while the chunks are consumed
+            with zipfile.ZipFile(file) as zf, zf.open(m) as zm:
+                yield from Frame.from_data(zm, src = m, **kwargs)
+        if kwargs.get('chunksize') is not None:
+            results = {m: _iter(m) for m in members}
+        elif workers > 1 and len(members) > 1 and isinstance(file, string_types):
+            with ThreadPoolExecutor(max_workers = min(workers, len(members))) as executor:
+                futures = {m: executor.submit(_read, m) for m in members}
+            for m, future in futures.items():
+                try:
+                    results.update({m: future.result()})
+                except:     raise IOError("Data %s cannot be read in source file... abort!" % m)
+        else:
             for m in members:
                 try:
-                    with zf.open(m) as zm:
-                        df = Frame.from_data(zm, **kwargs)
+                    results.update({m: _read(m)})
                 except:     raise IOError("Data %s cannot be read in source file... abort!" % m)
-                else:
-                    results.update({m: df})
         return results if len(results.keys())>1 else list(results.values())[0]
 
     #/************************************************************************/
@@ -1081,7 +2818,14 @@ class Frame(object):
         data = None
         try:
             assert Object.is_subclass(buffer, (io.RawIOBase,io.BufferedIOBase,io.FileIO))
-            data = Frame.from_data(io.BytesIO(buffer.read()), **kwargs)
+            try: # parse the stream directly (e.g., zip members), with no copy...
+                assert buffer.seekable()
+                data = Frame.from_data(buffer, **kwargs)
+            except AssertionError: # ... unless it cannot be rewound
+                data = Frame.from_data(io.BytesIO(buffer.read()), **kwargs)
+            except:
+                buffer.seek(0)
+                data = Frame.from_data(io.BytesIO(buffer.read()), **kwargs)
         except AssertionError:
             try:
                 assert Object.is_subclass(buffer, io.TextIOBase)
@@ -1105,9 +2849,50 @@ class Frame(object):
     #/************************************************************************/
     @staticmethod
     def from_file(file, src = None, **kwargs):
+        """Load file(s), possibly zipped or online, into dataframe(s).
+
+            >>> df = Frame.from_file(file, src = None, parse_cache = None, **kwargs)
+
+        Keyword arguments
+        -----------------
+        parse_cache : bool
+            flag set to store the parsed dataframe in the cache store 'cache_store'
+            (as Parquet), under a key built from the content of the source and the
+            reading options (see :meth:`parse_key`), and to return it directly when
+            the same source is read again with the same options; online sources shall
+            be cached as well ('caching' flag), since their key is derived from the
+            cached content; default: `False`.
         """
-        """
+        parse_cache = kwargs.pop('parse_cache', False)
+        online = isinstance(src or file, string_types) and any([(src or file).startswith(p) for p in PROTOCOLS])
+        key, cache = None, None
+        def _lookup(): # retrieve the parsed dataframe, if any
+            try:
+                key = Frame.parse_key(file, src = src, **kwargs)
+                assert key is not None
+                cache = Cache(kwargs.get('cache_store'))
+            except:
+                return None, None, None
+            entry = None if kwargs.get('cache_force') is True else cache.get(key, expire = -1)
+            with closing(cache.connect()) as conn, conn:
+                cache._count(conn, **{'parsed_hits' if entry else 'parsed_misses': 1})
+            if entry is not None:
+                try:
+                    return key, cache, Frame.from_arrow(entry['path'], fmt = 'parquet')
+                except:
+                    cache.remove(key)
+            return key, cache, None
+        parse_cache = parse_cache is True and _is_pyarrow_installed is True and kwargs.get('chunksize') is None
+        if parse_cache is True and online is False:
+            key, cache, data = _lookup()
+            if data is not None:
+                return data
         buffer = Buffer.from_file(file, src = src, **kwargs)
+        if parse_cache is True and online is True:
+            # the content is now in the cache store, up to date
+            key, cache, data = _lookup()
+            if data is not None:
+                return data
         if isinstance(buffer,string_types) or not isinstance(buffer,Mapping):
             buffer = {buffer: buffer}
         results = {}
@@ -1117,7 +2902,76 @@ class Frame(object):
             except:
                 data = Frame.from_buffer(buff, **kwargs)
             results.update({s: data})
-        return results if len(results.keys())>1 else results[s]
+        data = results if len(results.keys())>1 else results[s]
+        if key is not None and isinstance(data, pd.DataFrame):
+            tmp = '%s.%s' % (cache.tmp(key), uuid4().hex)
+            try:
+                data.to_parquet(tmp, engine = 'pyarrow', index = True)
+                cache.put(key, tmp, meta = {'src': str(src or file), 'file': str(file)}, move = True)
+            except:
+                logging.warning("\n! Parsed data not stored in cache !")
+                try:    os.remove(tmp)
+                except: pass
+        return data
+
+    #/************************************************************************/
+    @staticmethod
+    def parse_key(file, src = None, **kwargs):
+        """Build the key of a parsed dataframe in the cache, from the digest of
+        the content of the source (local file, or content of an online source
+        already in the cache store), the member file(s) read, and the reading
+        options.
+
+            >>> key = Frame.parse_key(file, src = None, **kwargs)
+
+        Returns
+        -------
+        key : str
+            the key, or `None` when the source or the options cannot be identified
+            (e.g., online source not in the cache store, or options like functions).
+        """
+        if src is None:
+            src, file = file, None
+        if not isinstance(src, string_types):
+            return None
+        if any([src.startswith(p) for p in PROTOCOLS]):
+            try: # contents are stored under their SHA-256 digest, see Cache.put
+                entry = Cache(kwargs.get('cache_store')).entry(src)
+                digest = osp.basename(entry['path'])
+                assert osp.dirname(entry['path']).endswith(osp.join('objects', digest[:2]))
+            except:
+                return None
+        elif osp.isfile(src):
+            h = hashlib.sha256()
+            with open(src, 'rb') as f:
+                for block in iter(lambda: f.read(DEF_BLOCKSIZE), b''):
+                    h.update(block)
+            digest = h.hexdigest()
+        else:
+            return None
+        def _normalise(v):
+            if isinstance(v, (set, frozenset)):
+                return sorted([_normalise(x) for x in v], key = repr)
+            elif isinstance(v, Mapping):
+                return {str(k): _normalise(x) for (k,x) in v.items()}
+            elif isinstance(v, (list, tuple)):
+                return [_normalise(x) for x in v]
+            elif isinstance(v, type):
+                return v.__name__
+            elif callable(v): # only predicates on sets, e.g. frozenset(...).__contains__
+                assert isinstance(getattr(v, '__self__', None), (set, frozenset))
+                return {'in': _normalise(v.__self__)}
+            elif v is None or isinstance(v, (bool, int, float, string_types)):
+                return v
+            else:
+                return str(v)
+        try:
+            opts = _normalise({k:v for (k,v) in kwargs.items() if k not in UNPARSED_KWARGS})
+        except AssertionError:
+            return None
+        key = json.dumps({'src': digest, 'file': _normalise(file), 'options': opts,
+                          'pandas': pd.__version__}, sort_keys = True, default = str)
+        return 'parsed:%s' % hashlib.sha256(key.encode('utf-8')).hexdigest()
 
 
 #==============================================================================
@@ -9,9 +9,10 @@ Module implementing miscellaneous useful methods.
 **Dependencies**
 
 *require*:      :mod:`os`, :mod:`six`, :mod:`collections`, :mod:`inspect`, :mod:`re`,
-                :mod:`numpy`, :mod:`datetime`, :mod:`time`, :mod:`operator`
+                :mod:`numpy`, :mod:`datetime`, :mod:`time`, :mod:`operator`,
+                :mod:`threading`, :mod:`tempfile`, :mod:`struct`, :mod:`hashlib`
 
-*optional*:     :mod:`dateutil`
+*optional*:     :mod:`dateutil`, :mod:`fcntl`, :mod:`msvcrt`
 
 *call*:         :mod:`pyeudatnat`
 
@@ -37,6 +38,18 @@ from six import string_types
 import time
 import datetime
 import calendar
+import threading
+import tempfile
+import struct
+import hashlib
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 try:
     import dateutil
 except ImportError:
@@ -60,6 +73,11 @@ ISWIN               = os.name=='nt' # sys.platform[0:3].lower()=='win'
 
 DEF_DATETIMEFMT     = '%d-%m-%Y %H:%M'
 
+DEF_LIMITDIR        = osp.join(tempfile.gettempdir(), 'pyeudatnat-limits')
+"""Default directory where the states of the limiters shared by the processes
+are stored.
+"""
+
 #%% Core functions/classes
 
 #==============================================================================
@@ -1797,3 +1815,216 @@ class FileSys(object):
         else:
             if ISWIN and filepath[-1]==':':     filepath+='\\'
             return osp.realpath(filepath)
+
+
+#==============================================================================
+# Class RateLimiter
+#==============================================================================
+
+class RateLimiter(object):
+    """Thread-safe token bucket limiting the rate of calls to a service; the
+    instances retrieved with :meth:`RateLimiter.get` are shared (per key) by all
+    the threads of a process.
+
+        >>> limiter = RateLimiter(rate = None, burst = 1)
+        >>> limiter.acquire()
+
+    Arguments
+    ---------
+    rate : float
+        maximum number of calls per second; `None` or non positive values mean
+        no limitation.
+    burst : int
+        maximum number of calls that can be made at once (size of the bucket).
+    """
+
+    __LIMITERS  = {}
+    __LOCK      = threading.Lock()
+
+    #/************************************************************************/
+    @classmethod
+    def get(cls, key, rate=None, burst=1, shared=False):
+        """Retrieve the limiter shared under a given key, creating it if needed.
+
+            >>> limiter = RateLimiter.get(key, rate = None, burst = 1, shared = False)
+
+        Keyword arguments
+        -----------------
+        shared : bool
+            flag set to share the limiter with all the processes running on the
+            host (see :class:`SharedRateLimiter`), and not only the threads of the
+            current process; default: `False`.
+        """
+        with cls.__LOCK:
+            limiter = cls.__LIMITERS.get(key)
+            if limiter is None or isinstance(limiter, SharedRateLimiter) != bool(shared):
+                limiter = None
+                if shared:
+                    try:
+                        limiter = SharedRateLimiter(key, rate, burst)
+                    except IOError:
+                        logging.warning("\n! Rate limiter not shared across processes - limit applied per process !")
+                limiter = cls.__LIMITERS[key] = limiter or RateLimiter(rate, burst)
+            elif (limiter.rate, limiter.burst) != (rate, burst):
+                limiter.reset(rate, burst)
+        return limiter
+
+    #/************************************************************************/
+    def __init__(self, rate=None, burst=1):
+        self.__lock = threading.Lock()
+        self.reset(rate, burst)
+
+    #/************************************************************************/
+    def reset(self, rate=None, burst=1):
+        if not (rate is None or isinstance(rate, (int,float))):
+            raise TypeError("Wrong format for RATE '%s' - must be a number" % rate)
+        elif not isinstance(burst, int) or burst < 1:
+            raise TypeError("Wrong format for BURST '%s' - must be a positive integer" % burst)
+        with self.__lock:
+            self.rate = rate if rate is not None and rate > 0 else None
+            self.burst = burst
+            self.tokens, self.last = float(burst), time.monotonic()
+
+    #/************************************************************************/
+    def acquire(self, tokens=1):
+        """Block until the call(s) can be made.
+
+            >>> wait = limiter.acquire(tokens = 1)
+
+        Returns
+        -------
+        wait : float
+            time (in seconds) spent waiting.
+        """
+        if self.rate is None:
+            return 0.
+        with self.__lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # reserve the tokens: concurrent callers queue up behind each other
+            self.tokens -= tokens
+            wait = - self.tokens / self.rate if self.tokens < 0 else 0.
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+#==============================================================================
+# Class SharedRateLimiter
+#==============================================================================
+
+class SharedRateLimiter(RateLimiter):
+    """Token bucket limiting the rate of calls to a service across all the processes
+    running on the host: the state of the bucket is stored in a lock file (keyed
+    by the service) that is exclusively locked while tokens are reserved, so that
+    the total throughput of concurrent workers never overshoots the rate.
+
+        >>> limiter = SharedRateLimiter(key, rate = None, burst = 1, dirname = None)
+        >>> limiter.acquire()
+
+    Arguments
+    ---------
+    key :
+        any hashable object with a stable representation identifying the service
+        (*e.g.*, the name of a geocoder or a host).
+    rate, burst :
+        see :class:`RateLimiter`.
+
+    Keyword arguments
+    -----------------
+    dirname : str
+        directory where the lock file is stored; default: :data:`DEF_LIMITDIR`.
+
+    Note
+    ----
+    Where file locking or the lock file is not available, the limiter falls back
+    to a bucket that is shared by the threads of the process only; so does
+    :meth:`RateLimiter.get` when the directory of the lock files cannot be
+    created.
+    """
+
+    STATE = struct.Struct('<dd') # tokens, time of last update
+
+    #/************************************************************************/
+    def __init__(self, key, rate=None, burst=1, dirname=None):
+        dirname = dirname or DEF_LIMITDIR
+        try:
+            os.makedirs(dirname, exist_ok = True)
+        except OSError:
+            raise IOError("Wrong DIRNAME '%s' - must be a writable directory" % dirname)
+        self.key = key
+        self.filename = osp.join(dirname,
+                                 '%s.lock' % hashlib.md5(repr(key).encode('utf-8')).hexdigest())
+        super(SharedRateLimiter, self).__init__(rate, burst)
+
+    #/************************************************************************/
+    @staticmethod
+    def lock(fd, release=False):
+        """Exclusively lock (or release) an open file descriptor, blocking until
+        the lock is obtained.
+
+            >>> SharedRateLimiter.lock(fd, release = False)
+        """
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN if release else fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK if release else msvcrt.LK_LOCK, 1)
+                except OSError:
+                    if release: raise
+                else:
+                    break
+
+    #/************************************************************************/
+    def acquire(self, tokens=1):
+        """Block until the call(s) can be made by any of the processes sharing the
+        limiter.
+
+            >>> wait = limiter.acquire(tokens = 1)
+
+        Returns
+        -------
+        wait : float
+            time (in seconds) spent waiting.
+        """
+        if self.rate is None:
+            return 0.
+        elif fcntl is None and msvcrt is None:
+            return super(SharedRateLimiter, self).acquire(tokens)
+        # the file is opened anew on every call: locks are then held by distinct
+        # open file descriptions, hence exclusive between threads and forked
+        # processes alike
+        try:
+            fd = os.open(self.filename, os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError:
+            logging.warning("\n! Lock file '%s' not available - limit applied per process !" % self.filename)
+            return super(SharedRateLimiter, self).acquire(tokens)
+        try:
+            self.lock(fd)
+            try:
+                # wall-clock time: monotonic clocks are not comparable across processes
+                now = time.time()
+                state = os.pread(fd, self.STATE.size, 0) if hasattr(os, 'pread') \
+                    else (os.lseek(fd, 0, os.SEEK_SET), os.read(fd, self.STATE.size))[1]
+                if len(state) == self.STATE.size:
+                    available, last = self.STATE.unpack(state)
+                    available = min(self.burst, available + max(now - last, 0.) * self.rate)
+                else:
+                    available = float(self.burst)
+                available -= tokens
+                state = self.STATE.pack(available, now)
+                if hasattr(os, 'pwrite'):
+                    os.pwrite(fd, state, 0)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET); os.write(fd, state)
+            finally:
+                self.lock(fd, release = True)
+        finally:
+            os.close(fd)
+        wait = - available / self.rate if available < 0 else 0.
+        if wait > 0:
+            time.sleep(wait)
+        return wait
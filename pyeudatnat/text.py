@@ -34,6 +34,9 @@ from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from six import string_types
 
+import numpy as np
+import pandas as pd
+
 try:
     assert True
     import googletrans as gtrans
@@ -110,6 +113,73 @@ LANGS           = { ## alpha-3/ISO 639-2 codes
 
 DEF_LANG        = 'en'
 
+ABBREVIATIONS   = { 'AT': {'str': 'strasse', '-str': 'strasse', 'pl': 'platz', 'g$': 'gasse'},
+                    'BE': {'^r': 'rue', 'av': 'avenue', 'bd': 'boulevard', 'pl': 'place',
+                           'chee': 'chaussee', 'str': 'straat', '-str': 'straat', 'ln': 'laan'},
+                    'CH': {'str': 'strasse', '-str': 'strasse', 'pl': 'platz', '^r': 'rue', 'av': 'avenue'},
+                    'DE': {'str': 'strasse', '-str': 'strasse', 'pl': 'platz', 'g$': 'gasse'},
+                    'ES': {'^c': 'calle', 'cl': 'calle', 'av': 'avenida', 'avda': 'avenida',
+                           'pza': 'plaza', 'pl': 'plaza', 'po': 'paseo', 'ctra': 'carretera'},
+                    'FR': {'^r': 'rue', 'av': 'avenue', 'ave': 'avenue', 'bd': 'boulevard',
+                           'bld': 'boulevard', 'pl': 'place', 'rte': 'route', 'chem': 'chemin',
+                           'imp': 'impasse', 'all': 'allee', 'fg': 'faubourg', 'st': 'saint',
+                           'ste': 'sainte'},
+                    'IE': {'^st': 'saint', 'st$': 'street', 'rd$': 'road', 'ave': 'avenue',
+                           'sq': 'square', 'ln': 'lane', 'dr$': 'drive', '^co': 'county'},
+                    'IT': {'^v': 'via', 'vle': 'viale', 'pza': 'piazza', 'pzza': 'piazza',
+                           'cso': 'corso', 'lgo': 'largo', 'loc': 'localita'},
+                    'LU': {'^r': 'rue', 'av': 'avenue', 'bd': 'boulevard', 'pl': 'place',
+                           'rte': 'route'},
+                    'NL': {'str': 'straat', '-str': 'straat', 'ln': 'laan', 'pl': 'plein', 'wg': 'weg'},
+                    'PT': {'^r': 'rua', 'av': 'avenida', 'pc': 'praca', 'lg': 'largo',
+                           'tv': 'travessa', 'estr': 'estrada'},
+                    'UK': {'^st': 'saint', 'st$': 'street', 'rd$': 'road', 'ave': 'avenue',
+                           'sq': 'square', 'ln': 'lane', 'dr$': 'drive'}
+                    }
+"""Abbreviations of the words used in the addresses (once case and accents are
+folded), per country, and their expansions used in the canonical keys; single
+letter and ambiguous abbreviations are only expanded at the start (leading '^',
+possibly after a house number) or at the end (trailing '$') of a field, e.g.
+'st' stands for 'saint' in 'St Martin St' and for 'street' at the end; a leading
+'-' denotes a suffix glued to the end of a word, e.g. '-str' in 'Hauptstr.' that
+then matches 'Hauptstraße'.
+"""
+
+POSTCODES       = { 'AT': (4, None, None),
+                    'BE': (4, None, None),
+                    'BG': (4, None, None),
+                    'CH': (4, None, None),
+                    'CY': (4, None, None),
+                    'CZ': (5, r'^(\d{3})\s*(\d{2})$', r'\1 \2'),
+                    'DE': (5, None, None),
+                    'DK': (4, None, None),
+                    'EE': (5, None, None),
+                    'EL': (5, r'^(\d{3})\s*(\d{2})$', r'\1 \2'),
+                    'ES': (5, None, None),
+                    'FI': (5, None, None),
+                    'FR': (5, None, None),
+                    'HR': (5, None, None),
+                    'HU': (4, None, None),
+                    'IT': (5, None, None),
+                    'LI': (4, None, None),
+                    'LT': (5, None, None),
+                    'LU': (4, None, None),
+                    'LV': (4, None, None),
+                    'MT': (None, r'^([A-Z]{3})\s*(\d{4})$', r'\1 \2'),
+                    'NL': (None, r'^(\d{4})\s*([A-Z]{2})$', r'\1 \2'),
+                    'NO': (4, None, None),
+                    'PL': (None, r'^(\d{2})\s*-?\s*(\d{3})$', r'\1-\2'),
+                    'PT': (None, r'^(\d{4})\s*-?\s*(\d{3})$', r'\1-\2'),
+                    'RO': (6, None, None),
+                    'SE': (5, r'^(\d{3})\s*(\d{2})$', r'\1 \2'),
+                    'SI': (4, None, None),
+                    'SK': (5, r'^(\d{3})\s*(\d{2})$', r'\1 \2')
+                    }
+"""Formats of the postcodes, per country: number of digits of the numeric codes
+(zero-padded when leading zeros were lost), and pattern and replacement of the
+canonical form.
+"""
+
 
 #%% Core functions/classes
 
@@ -284,6 +354,135 @@ class TextProcess(object):
         return delim.join(filter(lambda s: (s or '').strip(),
                                  [s.strip() for s in strings]))
 
+    #/************************************************************************/
+    @staticmethod
+    def join_columns(df, columns=None, delim = ', '):
+        """Vectorised join of the columns of a dataframe, row by row, that deals
+        with missing values and empty strings (see :meth:`join`).
+
+            >>> strings = TextProcess.join_columns(df, columns = None, delim = ', ')
+
+        Example
+        -------
+            >>> df = pd.DataFrame({'street': ['Rue de la Loi', None], 'number': [200, np.nan],
+                                   'city': ['Bruxelles', 'Namur']})
+            >>> TextProcess.join_columns(df)
+                0    Rue de la Loi, 200, Bruxelles
+                1                            Namur
+                dtype: object
+        """
+        if columns is None:
+            columns = df.columns
+        elif isinstance(columns, string_types):
+            columns = [columns,]
+        res = None
+        for col in columns:
+            s = df[col]
+            if pd.api.types.is_float_dtype(s.dtype) and (s.dropna() % 1 == 0).all():
+                s = s.astype('Int64') # e.g., numbers and postcodes read as floats
+            s = s.astype('string').str.strip()
+            s = s.mask(s == '')
+            if res is None:
+                res = s
+            else: # either part may be missing
+                res = (res + delim + s).fillna(res).fillna(s)
+        if res is None:
+            return pd.Series(np.nan, index = df.index, dtype = object)
+        return res.astype(object).where(res.notna(), np.nan)
+
+    #/************************************************************************/
+    @staticmethod
+    def normalise_postcode(codes, cc=None):
+        """Vectorised normalisation of postcodes into their canonical form, following
+        the format of the country (see :data:`POSTCODES`): country prefixes (e.g.,
+        'F-') are removed, the leading zeros lost when the codes were read as numbers
+        are restored, and the parts are separated as in the national format.
+
+            >>> codes = TextProcess.normalise_postcode(codes, cc = None)
+
+        Example
+        -------
+            >>> TextProcess.normalise_postcode([7500, 'F-75001', '1012ab'], cc = 'FR')
+                0    07500
+                1    75001
+                2    1012AB
+                dtype: object
+        """
+        if isinstance(codes, string_types):
+            codes = [codes,]
+        codes = pd.Series(codes).infer_objects()
+        if pd.api.types.is_float_dtype(codes.dtype) and (codes.dropna() % 1 == 0).all():
+            codes = codes.astype('Int64')
+        elif pd.api.types.is_object_dtype(codes.dtype): # mixed: numbers cast one by one
+            codes = codes.map(lambda c: int(c) if isinstance(c, float) and c.is_integer() else c)
+        codes = (codes.astype('string')
+                 .str.upper()
+                 .str.replace(r'^\s*[A-Z]{1,2}\s*-\s*', '', regex = True)
+                 .str.strip())
+        ndigits, pattern, repl = POSTCODES.get(cc) or (None, None, None)
+        if ndigits is not None:
+            digits = codes.str.fullmatch(r'\d{1,%s}' % ndigits).fillna(False).astype(bool)
+            codes = codes.mask(digits, codes.str.zfill(ndigits))
+        if pattern is not None:
+            codes = codes.str.replace(pattern, repl, regex = True)
+        codes = codes.mask(codes == '')
+        return codes.astype(object).where(codes.notna(), np.nan)
+
+    #/************************************************************************/
+    @staticmethod
+    def normalise(strings, cc=None, accents=True):
+        """Vectorised normalisation of strings into canonical keys: accents are
+        removed, the case is folded, punctuation and whitespaces are harmonised, and
+        the abbreviations of the country (see :data:`ABBREVIATIONS`) are expanded;
+        empty strings are returned as NaN.
+
+            >>> keys = TextProcess.normalise(strings, cc = None, accents = True)
+
+        Keyword arguments
+        -----------------
+        cc : str
+            country code of the abbreviations expanded; default: none is expanded.
+        accents : bool
+            flag set to remove the accents and other diacritics; default: `True`.
+
+        Example
+        -------
+            >>> TextProcess.normalise(['  Rue  de la Loi, Bruxelles', 'r. de la loi ,BRUXELLES', ''],
+                                      cc = 'BE')
+                0    rue de la loi, bruxelles
+                1    rue de la loi, bruxelles
+                2                         NaN
+                dtype: object
+        """
+        if isinstance(strings, string_types):
+            strings = [strings,]
+        strings = pd.Series(strings).astype('string')
+        codes, uniques = pd.factorize(strings) # distinct strings are normalised once
+        uniques = pd.Series(uniques, dtype = 'string')
+        if accents is True:
+            uniques = (uniques.str.normalize('NFKD')
+                       .str.replace('[\u0300-\u036f]', '', regex = True))
+        uniques = (uniques.str.casefold()
+                   .str.replace(r'(?<=\w)\.(?=\w)', '', regex = True) # e.g., 'p.za'
+                   .str.replace(r'[.;:/()"]', ' ', regex = True)
+                   .str.replace(r'\s*,[\s,]*', ', ', regex = True)
+                   .str.replace(r'\s+', ' ', regex = True)
+                   .str.strip(' ,'))
+        for abbr, word in (ABBREVIATIONS.get(cc) or {}).items():
+            if abbr.startswith('^'): # first word of a field, possibly after a number
+                pattern, word = r'(^|, )(\d+\S* )?%s\b' % re.escape(abbr[1:]), r'\g<1>\g<2>%s' % word
+            elif abbr.startswith('-'): # suffix of a word, e.g. 'hauptstr'
+                pattern = r'(?<=[^\W\d])%s(?![^\W\d])' % re.escape(abbr[1:])
+            elif abbr.endswith('$'): # last word of a field
+                pattern = r'\b%s(?=,|$)' % re.escape(abbr[:-1])
+            else:
+                pattern = r'\b%s\b' % re.escape(abbr)
+            uniques = uniques.str.replace(pattern, word, regex = True)
+        uniques = uniques.mask(uniques == '')
+        res = uniques.astype(object).where(uniques.notna(), np.nan).to_numpy()
+        res = np.append(res, np.nan)[codes] # missing strings pick the last item
+        return pd.Series(res, index = strings.index, dtype = object)
+
     #/************************************************************************/
     @staticmethod
     def sub_patterns(strings, pattern):